@@ -230,10 +230,14 @@ def load_mission_data():
         if files:
             try:
                 df = pd.concat([pd.read_csv(f, low_memory=False) for f in files], ignore_index=True)
-                df['state'] = df['state'].apply(clean_state_name)
+                states = df['state'].unique()
+                df['state'] = df['state'].map({s: clean_state_name(s) for s in states})
                 df = df[~df['state'].str.isnumeric()]
                 df['date'] = pd.to_datetime(df['date'], dayfirst=True, errors='coerce')
-                data[key] = df.dropna(subset=['date'])
+                df = df.dropna(subset=['date'])
+                for col in ['state', 'district', 'pincode']:
+                    df[col] = df[col].astype('category')
+                data[key] = df
                 health[folder] = f"✅ Active ({len(files)} files)"
             except Exception as e:
                 health[folder] = f"❌ Error: {str(e)}"
@@ -0,0 +1,93 @@
+"""Benchmark: pandas vs. DuckDB query backends, uncached latency.
+
+Usage (from the repo root):
+    python backend/benchmarks/bench_backends.py [--repeat 5] [--states 6]
+
+Both backends answer the same loaded DataState with the response cache bypassed, over a
+grid of presets, a custom range, nation/state/district filters, levels, granularities and
+streams; p50/p95 latency per query kind is reported side by side. Output parity is
+covered by ``backend/tests/test_backends.py``.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from timing import summarize, time_calls  # noqa: E402
+
+STREAMS = ["enrol", "bio", "demo", "combined"]
+
+
+def cases(store: main.DataStore, states: int) -> List[Tuple[str, Callable[[main.QueryBackend], object]]]:
+    windows = [main.resolve_window(preset, None, None, store.max_date) for preset in ("1m", "3m", "6m", "1y")]
+    windows.append((store.min_date, store.max_date))
+    filters = [(None, None)]
+    for state, districts in list(store.state_to_district.items())[:states]:
+        filters.append((state, None))
+        if districts:
+            filters.extend([(state, districts[0]), (None, districts[-1])])
+
+    queries = []
+    for state, district in filters:
+        for window in windows:
+            queries.append(("summary", lambda b, s=state, d=district, w=window: b.summary(store, s, d, w)))
+            for stream in STREAMS:
+                for granularity in ("monthly", "quarterly", "yearly"):
+                    queries.append(
+                        (
+                            "timeseries",
+                            lambda b, s=state, d=district, w=window, g=granularity, st=stream: b.timeseries(
+                                store, s, d, w, g, st
+                            ),
+                        )
+                    )
+                for level in ("state", "district"):
+                    queries.append(
+                        ("map", lambda b, s=state, d=district, w=window, lv=level, st=stream: b.map_view(store, s, d, w, lv, st))
+                    )
+            queries.append(
+                ("comparisons", lambda b, s=state, d=district, w=window: store._comparisons(b.map_view(store, s, d, w, "state")))
+            )
+            queries.append(
+                ("insights", lambda b, s=state, d=district, w=window: store._insights(b.map_view(store, s, d, w, "state")))
+            )
+    return queries
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--states", type=int, default=6, help="states (and one district each) in the filter grid")
+    args = parser.parse_args()
+
+    store = main.store
+    store.load()
+    backends = {"pandas": main.PandasBackend(), "duckdb": main.DuckDBBackend()}
+    queries = cases(store, args.states)
+
+    started = time.perf_counter()
+    backends["duckdb"].prepare(store.current)
+    print(f"duckdb registration: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    samples: Dict[Tuple[str, str], List[float]] = {}
+    for _ in range(args.repeat):
+        for kind, query in queries:
+            for name, backend in backends.items():
+                samples.setdefault((kind, name), []).extend(time_calls(lambda: query(backend), 1))
+
+    print(f"{'query':<12} {'calls':>6} " + " ".join(f"{name + ' p50':>11} {name + ' p95':>11}" for name in backends))
+    for kind in dict.fromkeys(kind for kind, _ in queries):
+        line = f"{kind:<12} {len(samples[(kind, 'pandas')]):>6} "
+        for name in backends:
+            timing = summarize(samples[(kind, name)])
+            line += f"{timing['p50_ms']:>11.2f} {timing['p95_ms']:>11.2f} "
+        print(line.rstrip())
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,214 @@
+"""Benchmark suite: load time, peak memory and per-endpoint latency on synthetic data.
+
+Usage (from the repo root):
+    python backend/benchmarks/bench_endpoints.py [--scale 1 10 100] [--output results.json]
+    python backend/benchmarks/bench_endpoints.py --scale 10 --compare baseline.json [--tolerance 0.25]
+
+For every ``--scale`` a synthetic dataset is generated with ``synth_data.py`` (reused
+from ``--data-root`` when it already exists there) and measured in a fresh interpreter
+with the snapshot cache and preset materialization disabled: cold load time, peak RSS,
+then p50/p95 latency of every ``DataStore`` query method and every FastAPI route
+(through ``TestClient``), with the response cache cleared before each call. Results are
+printed and written as JSON. ``--compare`` checks them against an earlier JSON file and
+exits with status 1 when a metric is more than ``--tolerance`` worse.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from synth_data import dataset_dir  # noqa: E402
+from timing import summarize, time_calls  # noqa: E402
+
+
+def rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def latency(call: Callable[[], object], repeat: int) -> Dict[str, float]:
+    return summarize(time_calls(call, repeat, before=main.store.responses.clear))
+
+
+def child(repeat: int) -> None:
+    from fastapi.testclient import TestClient
+
+    store = main.store
+    started = time.perf_counter()
+    store.start_loading()
+    store.wait_ready()
+    load_seconds = time.perf_counter() - started
+    load_rss = rss_mb()
+
+    state = max(store.state_to_district, key=lambda name: len(store.state_to_district[name]))
+    district = store.state_to_district[state][0]
+    methods = {}
+    for label, filters in (("", (None, None)), ("[state]", (state, None)), ("[district]", (state, district))):
+        args = (*filters, "6m", None, None)
+        calls = {
+            "summary": lambda: store.summary(*args),
+            "working_age_timeseries": lambda: store.working_age_timeseries(*args, "monthly"),
+            "map_view": lambda: store.map_view(*args, "district" if filters[0] else "state"),
+            "pincodes": lambda: store.pincodes(*args, 50, 0),
+            "risk": lambda: store.risk(*args, "district" if filters[0] else "state"),
+            "anomalies": lambda: store.anomalies(*args, "district" if filters[0] else "state", "enrol", 50),
+            "comparisons": lambda: store.comparisons(*args),
+            "insights": lambda: store.insights(*args),
+            "dashboard": lambda: store.dashboard(*args, "monthly", "state"),
+        }
+        for name, call in calls.items():
+            methods[name + label] = latency(call, repeat)
+
+    routes = {}
+    query = {"state": state}
+    urls = [
+        ("/health", {}),
+        ("/meta", {}),
+        ("/summary", {}),
+        ("/summary", query),
+        ("/timeseries", {"granularity": "monthly"}),
+        ("/timeseries", {**query, "stream": "combined"}),
+        ("/map", {"level": "state"}),
+        ("/map", {**query, "level": "district"}),
+        ("/pincodes", query),
+        ("/risk", {"level": "state"}),
+        ("/anomalies", {"level": "district"}),
+        ("/comparisons", {}),
+        ("/insights", {}),
+        ("/dashboard", {}),
+        ("/dashboard", query),
+    ]
+    with TestClient(main.app) as client:  # the loader already ran, so startup does not reload
+        for path, params in urls:
+            label = path + ("?" + "&".join(f"{key}={value}" for key, value in params.items()) if params else "")
+            routes[label] = latency(lambda: client.get(path, params=params).raise_for_status(), repeat)
+
+    print(
+        json.dumps(
+            {
+                "rows": {key: len(df) for key, df in store.datasets.items()},
+                "load_seconds": round(load_seconds, 3),
+                "load_peak_rss_mb": round(load_rss, 1),
+                "peak_rss_mb": round(rss_mb(), 1),
+                "methods": methods,
+                "routes": routes,
+            }
+        )
+    )
+
+
+def measure(data_dir: Path, repeat: int) -> Dict[str, object]:
+    env = {
+        **os.environ,
+        "UIDAI_DATA_DIR": str(data_dir),
+        "UIDAI_CACHE_DIR": "",
+        "UIDAI_MATERIALIZE": "0",
+        "UIDAI_RELOAD_INTERVAL": "0",
+    }
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", "--repeat", str(repeat)], env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def metrics(result: Dict[str, object]) -> Dict[str, float]:
+    """Flatten one scale's result to ``name -> value`` where larger is worse."""
+    flat = {"load_seconds": result["load_seconds"], "peak_rss_mb": result["peak_rss_mb"]}
+    for group in ("methods", "routes"):
+        for name, timing in result[group].items():
+            flat[f"{group[:-1]} {name} p50_ms"] = timing["p50_ms"]
+    return flat
+
+
+def compare(results: Dict[str, object], baseline: Dict[str, object], tolerance: float) -> int:
+    regressions = 0
+    for scale, result in results["scales"].items():
+        previous = baseline.get("scales", {}).get(scale)
+        if previous is None:
+            print(f"scale {scale}: not in baseline")
+            continue
+        old = metrics(previous)
+        for name, value in metrics(result).items():
+            if name not in old or not old[name]:
+                continue
+            ratio = value / old[name]
+            # Sub-millisecond timings are mostly noise; only flag them past 1 ms.
+            if ratio > 1 + tolerance and not (name.endswith("_ms") and value < 1.0):
+                regressions += 1
+                print(f"REGRESSION scale {scale} {name}: {old[name]} -> {value} ({ratio:.2f}x)")
+    print(f"{regressions} regression(s) against {baseline.get('commit') or 'baseline'} (tolerance {tolerance:.0%})")
+    return regressions
+
+
+def git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=main.BASE_DIR, capture_output=True, text=True)
+        return out.stdout.strip()
+    except OSError:
+        return ""
+
+
+def report(scale: str, result: Dict[str, object]) -> None:
+    rows = ", ".join(f"{key}={count}" for key, count in result["rows"].items())
+    print(f"\nscale {scale}: {rows}")
+    print(f"  load {result['load_seconds']:.2f}s, peak RSS {result['peak_rss_mb']:.0f} MB (after load {result['load_peak_rss_mb']:.0f} MB)")
+    for group in ("methods", "routes"):
+        for name, timing in result[group].items():
+            print(f"  {name:<42} p50 {timing['p50_ms']:>9.2f} ms   p95 {timing['p95_ms']:>9.2f} ms")
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, nargs="+", default=[1, 10])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--data-root", type=Path, help="keep generated datasets here and reuse them across runs")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="earlier JSON results to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.repeat)
+        return
+
+    results: Dict[str, object] = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "days": args.days,
+        "seed": args.seed,
+        "scales": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="uidai-synth-") as scratch:
+        root = args.data_root or Path(scratch)
+        for scale in args.scale:
+            label = f"{scale:g}"
+            data_dir = dataset_dir(root, scale, args.days, args.seed)
+            results["scales"][label] = measure(data_dir, args.repeat)
+            report(label, results["scales"][label])
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nwrote {args.output}")
+    if args.compare:
+        print()
+        sys.exit(1 if compare(results, json.loads(args.compare.read_text()), args.tolerance) else 0)
+
+
+if __name__ == "__main__":
+    run()
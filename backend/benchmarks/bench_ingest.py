@@ -0,0 +1,59 @@
+"""Micro-benchmark: legacy row-wise CSV cleaning vs. the vectorized categorical path.
+
+Usage (from the repo root):
+    python backend/benchmarks/bench_ingest.py [--repeat 5]
+
+Snapshots are bypassed so both paths parse the CSVs from scratch.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from timing import percentile, time_calls  # noqa: E402
+
+
+def legacy_clean(path: Path) -> pd.DataFrame:
+    df = pd.read_csv(path, low_memory=False)
+    df["state"] = df["state"].apply(main.clean_state_name)
+    df = df[~df["state"].str.isnumeric()]
+    df["date"] = pd.to_datetime(df["date"], dayfirst=True, errors="coerce")
+    return df.dropna(subset=["date"])
+
+
+def vectorized_clean(path: Path) -> pd.DataFrame:
+    return main.clean_frame(pd.read_csv(path, low_memory=False))
+
+
+def timed(fn, path: Path, repeat: int):
+    """Median seconds of ``repeat`` runs, and the last run's frame."""
+    last = {}
+    samples = time_calls(lambda: last.update(frame=fn(path)), repeat)
+    return percentile(samples, 50) / 1000, last["frame"]
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    files = sorted(path for folder in main.CSV_FOLDERS.values() for path in (main.BASE_DIR / folder).glob("*.csv"))
+    if not files:
+        sys.exit("no bundled CSVs found")
+
+    print(f"{'file':<48} {'rows':>8} {'legacy s':>9} {'new s':>9} {'legacy MB':>10} {'new MB':>8}")
+    for path in files:
+        legacy_s, legacy_df = timed(legacy_clean, path, args.repeat)
+        new_s, new_df = timed(vectorized_clean, path, args.repeat)
+        legacy_mb = legacy_df.memory_usage(deep=True).sum() / 1e6
+        new_mb = new_df.memory_usage(deep=True).sum() / 1e6
+        print(f"{path.name:<48} {len(new_df):>8} {legacy_s:>9.3f} {new_s:>9.3f} {legacy_mb:>10.1f} {new_mb:>8.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,67 @@
+"""Benchmark: cold load time vs. number of ingest worker processes.
+
+Usage (from the repo root):
+    python backend/benchmarks/bench_ingest_scaling.py [--copies 4] [--workers 1 2 4 8]
+
+Each worker count runs in a fresh interpreter with the snapshot cache disabled, loading
+``--copies`` symlinked copies of every bundled CSV so there are enough files to spread
+across the pool.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def link_copies(root: Path, copies: int) -> None:
+    for folder in main.CSV_FOLDERS.values():
+        (root / folder).mkdir(parents=True)
+        for path in (main.BASE_DIR / folder).glob("*.csv"):
+            for copy in range(copies):
+                (root / folder / f"{path.stem}_copy{copy}.csv").symlink_to(path)
+
+
+def child() -> None:
+    started = time.perf_counter()
+    main.store.load()
+    elapsed = time.perf_counter() - started
+    rows = sum(len(df) for df in main.store.datasets.values())
+    print(json.dumps({"seconds": elapsed, "rows": rows}))
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=4)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+        return
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        link_copies(Path(data_dir), args.copies)
+        print(f"copies={args.copies} cpus={os.cpu_count()}")
+        print(f"{'workers':>7} {'load s':>8} {'speedup':>8} {'rows':>10}")
+        serial = None
+        for workers in args.workers:
+            env = {**os.environ, "UIDAI_DATA_DIR": data_dir, "UIDAI_CACHE_DIR": "", "UIDAI_INGEST_WORKERS": str(workers)}
+            out = subprocess.run(
+                [sys.executable, __file__, "--child"], env=env, capture_output=True, text=True, check=True
+            )
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            serial = serial or result["seconds"]
+            print(f"{workers:>7} {result['seconds']:>8.2f} {serial / result['seconds']:>7.2f}x {result['rows']:>10}")
+
+
+if __name__ == "__main__":
+    run()
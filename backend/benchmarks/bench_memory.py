@@ -0,0 +1,156 @@
+"""Benchmark: peak RSS and in-memory footprint of loading the CSV folders, legacy full-file read vs. streaming.
+
+Usage (from the repo root):
+    python backend/benchmarks/bench_memory.py [--scale 1 10] [--chunk-rows 250000] [--data-root DIR]
+
+For every ``--scale`` a synthetic dataset of distinct rows is generated with
+``synth_data.py`` (reused from ``--data-root`` when it already exists there). Each mode
+runs in a fresh interpreter with the snapshot cache disabled. The streaming footprint
+covers everything the loaded DataState holds: the pincode frames, the per-dataset and
+combined rollups, and the window and pincode indexes (sort permutations, dates, running
+totals, composite keys and key lookups). Arrays shared between them are counted once.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from synth_data import dataset_dir  # noqa: E402
+
+PARTS = ["frames", "rollups", "indexes"]
+
+
+def rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def legacy_load() -> Dict[str, int]:
+    footprint = 0
+    for folder in main.CSV_FOLDERS.values():
+        files = main.list_csv_files(folder)
+        if not files:
+            continue
+        df = pd.concat([pd.read_csv(path, low_memory=False) for path in files], ignore_index=True)
+        df["state"] = df["state"].apply(main.clean_state_name)
+        df = df[~df["state"].str.isnumeric()]
+        df["date"] = pd.to_datetime(df["date"], dayfirst=True, errors="coerce")
+        df = df.dropna(subset=["date"])
+        footprint += int(df.memory_usage(deep=True).sum())
+    return {"frames": footprint}
+
+
+def base_array(values: np.ndarray) -> np.ndarray:
+    while isinstance(values.base, np.ndarray):
+        values = values.base
+    return values
+
+
+def state_footprint(data: main.DataState) -> Dict[str, int]:
+    """Bytes held by ``data`` per part, counting each frame and array once."""
+    sizes = dict.fromkeys(PARTS, 0)
+    seen: Set[int] = set()
+
+    def add_frame(part: str, df: pd.DataFrame) -> None:
+        if id(df) in seen:
+            return
+        seen.add(id(df))
+        sizes[part] += int(df.memory_usage(deep=True).sum())
+        for col in df.columns:
+            column = df[col]
+            values = column.cat.codes.to_numpy() if isinstance(column.dtype, pd.CategoricalDtype) else column.to_numpy()
+            seen.add(id(base_array(values)))
+
+    def add_array(part: str, values: Optional[np.ndarray]) -> None:
+        if values is None or id(base_array(values)) in seen:
+            return
+        seen.add(id(base_array(values)))
+        sizes[part] += base_array(values).nbytes
+
+    def add_lookup(part: str, lookup: Dict) -> None:
+        sizes[part] += sys.getsizeof(lookup) + sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in lookup.items())
+
+    for df in data.datasets.values():
+        add_frame("frames", df)
+    for df in data.rollups.values():
+        add_frame("rollups", df)
+    indexes = [index for group in data.indexes.values() for index in group] + list(data.pincode_indexes.values())
+    for index in indexes:
+        add_frame("indexes", index.frame)
+        for values in (index.order, index.dates, index.cumsum, getattr(index, "composite", None)):
+            add_array("indexes", values)
+        add_lookup("indexes", index.bounds)
+        if isinstance(index, main.PincodeIndex):
+            add_frame("indexes", index.group_keys)
+            add_lookup("indexes", index.runs)
+    return sizes
+
+
+def streaming_load() -> Dict[str, int]:
+    main.store.load()
+    return state_footprint(main.store.current)
+
+
+def child(mode: str) -> None:
+    baseline = rss_mb()
+    footprint = legacy_load() if mode == "legacy" else streaming_load()
+    print(json.dumps({"baseline": baseline, "peak": rss_mb(), "footprint": {k: v / 1e6 for k, v in footprint.items()}}))
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, nargs="+", default=[1, 10])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-rows", type=int, default=main.CHUNK_ROWS)
+    parser.add_argument("--data-root", type=Path, help="keep generated datasets here and reuse them across runs")
+    parser.add_argument("--child", choices=["legacy", "streaming"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="uidai-synth-") as scratch:
+        for scale in args.scale:
+            data_dir = dataset_dir(args.data_root or Path(scratch), scale, args.days, args.seed)
+            env = {
+                **os.environ,
+                "UIDAI_DATA_DIR": str(data_dir),
+                "UIDAI_CACHE_DIR": "",
+                "UIDAI_MATERIALIZE": "0",
+                "UIDAI_RELOAD_INTERVAL": "0",
+                "UIDAI_CHUNK_ROWS": str(args.chunk_rows),
+            }
+            print(f"\nscale={scale:g} chunk_rows={args.chunk_rows}")
+            print(
+                f"{'mode':<10} {'baseline MB':>12} {'peak MB':>8} {'load delta MB':>14} "
+                + " ".join(f"{part + ' MB':>11}" for part in PARTS)
+                + f" {'total MB':>9}"
+            )
+            for mode in ("legacy", "streaming"):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", mode], env=env, capture_output=True, text=True, check=True
+                )
+                result = json.loads(out.stdout.strip().splitlines()[-1])
+                delta = result["peak"] - result["baseline"]
+                footprint = result["footprint"]
+                print(
+                    f"{mode:<10} {result['baseline']:>12.1f} {result['peak']:>8.1f} {delta:>14.1f} "
+                    + " ".join(f"{footprint.get(part, 0.0):>11.1f}" for part in PARTS)
+                    + f" {sum(footprint.values()):>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    run()
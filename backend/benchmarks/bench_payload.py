@@ -0,0 +1,64 @@
+"""Benchmark: /map and /timeseries payload size and serialization time per response format.
+
+Usage (from the repo root):
+    python backend/benchmarks/bench_payload.py [--repeat 200]
+
+Compares row-shaped and columnar payloads, raw and gzipped, and times the FastAPI
+default path (``jsonable_encoder`` + stdlib ``json``) against the orjson response class.
+The district payload is every state's district map concatenated.
+"""
+
+import argparse
+import gzip
+import sys
+import time
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def payloads():
+    store = main.store
+    districts = []
+    for state in store.state_to_district:
+        districts.extend(store.map_view(state, None, "1y", None, None, "district"))
+    timeseries = store.working_age_timeseries(None, None, None, "2000-01-01", None, "monthly")
+    return {"map?level=district": districts, "timeseries": timeseries}
+
+
+def timed(render, payload, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        render(payload)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    main.store.load()
+    renderers = {
+        "fastapi default": lambda payload: JSONResponse(jsonable_encoder(payload)).body,
+        "stdlib json": lambda payload: JSONResponse(payload).body,
+        main.PayloadResponse.__name__: lambda payload: main.PayloadResponse(payload).body,
+    }
+    print(f"{'payload':<20} {'shape':<8} {'rows':>6} {'bytes':>9} {'gzip':>8} " + " ".join(f"{n + ' ms':>18}" for n in renderers))
+    for name, rows in payloads().items():
+        for shape, payload in (("rows", rows), ("columns", main.to_columns(rows))):
+            body = main.PayloadResponse(payload).body
+            times = [timed(render, payload, args.repeat) for render in renderers.values()]
+            print(
+                f"{name:<20} {shape:<8} {len(rows):>6} {len(body):>9} {len(gzip.compress(body)):>8} "
+                + " ".join(f"{ms:>18.3f}" for ms in times)
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,100 @@
+"""Benchmark: time from launching uvicorn to first byte and to per-dataset readiness.
+
+Usage (from the repo root):
+    python backend/benchmarks/bench_startup.py [--runs 3] [--cold]
+
+``--cold`` points the snapshot cache at an empty temporary directory so every CSV
+is parsed; otherwise the existing Arrow snapshots are used.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Optional
+
+from loadtest import BACKEND_DIR, free_port
+from timing import percentile
+
+MILESTONES = ["health", "enrol", "map", "all", "summary"]
+
+
+def get(port: int, path: str) -> Optional[http.client.HTTPResponse]:
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+        conn.request("GET", path)
+        return conn.getresponse()
+    except OSError:
+        return None
+
+
+def one_run(cache_dir: Optional[str]) -> Dict[str, float]:
+    port = free_port()
+    env = {**os.environ, "UIDAI_RELOAD_INTERVAL": "0"}
+    if cache_dir is not None:
+        env["UIDAI_CACHE_DIR"] = cache_dir
+    began = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    marks: Dict[str, float] = {}
+    try:
+        while "health" not in marks:
+            response = get(port, "/health")
+            if response is None:
+                time.sleep(0.01)
+                continue
+            marks["health"] = time.perf_counter() - began
+        while "all" not in marks:
+            ready = json.loads(get(port, "/health").read())["ready"]
+            if ready.get("enrol") and "enrol" not in marks:
+                marks["enrol"] = time.perf_counter() - began
+                get(port, "/map?preset=3m").read()
+                marks["map"] = time.perf_counter() - began
+            if all(ready.values()):
+                marks["all"] = time.perf_counter() - began
+            else:
+                time.sleep(0.01)
+        get(port, "/summary?preset=3m").read()
+        marks["summary"] = time.perf_counter() - began
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    return marks
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--cold", action="store_true", help="parse CSVs instead of reading snapshots")
+    args = parser.parse_args()
+
+    runs = []
+    for _ in range(args.runs):
+        if args.cold:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                runs.append(one_run(cache_dir))
+        else:
+            runs.append(one_run(None))
+
+    labels = {
+        "health": "first byte (/health)",
+        "enrol": "enrolment ready",
+        "map": "first /map answered",
+        "all": "all datasets ready",
+        "summary": "first /summary answered",
+    }
+    print(f"{'milestone':<26} {'median s':>9} {'min s':>7} {'max s':>7}")
+    for key in MILESTONES:
+        values = [marks[key] for marks in runs if key in marks]
+        print(f"{labels[key]:<26} {percentile(values, 50):>9.3f} {min(values):>7.3f} {max(values):>7.3f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,71 @@
+"""Benchmark: /timeseries computation before and after dropping prints and iterrows.
+
+Usage (from the repo root):
+    python backend/benchmarks/bench_timeseries.py [--repeat 50]
+
+Both paths run on the same enrolment slice with the response cache bypassed. The
+legacy path writes its debug prints to os.devnull, so the figures understate the
+cost of writing to a real terminal or log pipe.
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from timing import summarize, time_calls  # noqa: E402
+
+
+def legacy_timeseries(enrol: pd.DataFrame, granularity: str) -> List[Dict[str, object]]:
+    if enrol.empty:
+        print("Enrol DataFrame is empty after filtering.")
+        return []
+    print(f"Enrol DataFrame head after filtering:\n{enrol.head()}")
+    freq = {"monthly": "ME", "quarterly": "QE", "yearly": "YE"}.get(granularity, "ME")
+    grouped = enrol.set_index("date")[["age_0_5", "age_5_17", "age_18_greater"]].resample(freq).sum().reset_index()
+    print(f"Grouped DataFrame head after resampling:\n{grouped.head()}")
+    grouped["total"] = grouped[["age_0_5", "age_5_17", "age_18_greater"]].sum(axis=1)
+    grouped["adult_share"] = np.where(grouped["total"] > 0, grouped["age_18_greater"] / grouped["total"], 0)
+    print(f"Grouped DataFrame head after calculating total and adult_share:\n{grouped.head()}")
+    return [
+        {
+            "date": row["date"].date().isoformat(),
+            "adultShare": round(row["adult_share"] * 100, 2),
+            "totalActivity": int(row["total"]),
+        }
+        for _, row in grouped.iterrows()
+    ]
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    store = main.store
+    store.load()
+    window = (store.min_date, store.max_date)
+    enrol = store._filter_df("enrol", None, None, *window)
+    print(f"enrolment rows in window: {len(enrol)}")
+    print(f"{'granularity':<12} {'legacy p50 ms':>14} {'new p50 ms':>11} {'legacy p95 ms':>14} {'new p95 ms':>11}")
+    with open(os.devnull, "w") as devnull:
+        for granularity in ("monthly", "quarterly", "yearly"):
+            with contextlib.redirect_stdout(devnull):
+                legacy = summarize(time_calls(lambda: legacy_timeseries(enrol, granularity), args.repeat))
+            new = summarize(time_calls(lambda: main.timeseries_payload(enrol, granularity), args.repeat))
+            print(
+                f"{granularity:<12} {legacy['p50_ms']:>14.2f} {new['p50_ms']:>11.2f} "
+                f"{legacy['p95_ms']:>14.2f} {new['p95_ms']:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,81 @@
+"""Benchmark: memory per uvicorn worker, private DataStores vs. shared memory-mapped segments.
+
+Usage (from the repo root):
+    python backend/benchmarks/bench_workers_rss.py [--workers 1 4 8]
+
+For each worker count a local uvicorn is started twice: once with every worker loading its
+own copy of the data, once with ``UIDAI_SHARED_DIR`` set so one worker loads and the others
+map its segment. Once the workers are warm and their memory has settled, RSS, PSS
+(shared pages split between the processes mapping them) and USS (private pages) are
+summed over the workers. PSS is the fair per-worker cost. Needs ``psutil`` (Linux).
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+import psutil
+
+from loadtest import BACKEND_DIR, free_port, wait_until_up
+
+
+def workers_of(server: subprocess.Popen) -> List[psutil.Process]:
+    children = [
+        proc for proc in psutil.Process(server.pid).children(recursive=True)
+        if "resource_tracker" not in " ".join(proc.cmdline())
+    ]
+    return children or [psutil.Process(server.pid)]
+
+
+def settled_memory(server: subprocess.Popen, timeout: float = 180.0) -> list:
+    """Sample worker memory until the total stops growing (all workers loaded or attached)."""
+    deadline = time.monotonic() + timeout
+    previous, stable = 0, 0
+    while time.monotonic() < deadline:
+        samples = [proc.memory_full_info() for proc in workers_of(server)]
+        total = sum(sample.rss for sample in samples)
+        stable = stable + 1 if abs(total - previous) < 0.01 * total else 0
+        if stable >= 3:
+            return samples
+        previous = total
+        time.sleep(1.0)
+    return samples
+
+
+def measure(workers: int, shared_dir: str) -> list:
+    host, port = "127.0.0.1", free_port()
+    env = {**os.environ, "UIDAI_RELOAD_INTERVAL": "0", "UIDAI_SHARED_DIR": shared_dir}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", host, "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    try:
+        wait_until_up(host, port)
+        return settled_memory(server)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} {'mode':<8} {'RSS MB':>8} {'PSS MB':>8} {'USS MB':>8} {'PSS/worker':>11}")
+    for workers in args.workers:
+        for mode in ("private", "shared"):
+            with tempfile.TemporaryDirectory(prefix="uidai-shared-") as shared_dir:
+                samples = measure(workers, shared_dir if mode == "shared" else "")
+            rss, pss, uss = (sum(getattr(sample, field) for sample in samples) / 1e6 for field in ("rss", "pss", "uss"))
+            print(f"{workers:>7} {mode:<8} {rss:>8.1f} {pss:>8.1f} {uss:>8.1f} {pss / len(samples):>11.1f}")
+
+
+if __name__ == "__main__":
+    run()
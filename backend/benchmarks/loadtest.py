@@ -0,0 +1,152 @@
+"""Load test: latency percentiles for the API under concurrent dashboard clients.
+
+Usage (from the repo root):
+    python backend/benchmarks/loadtest.py [--clients 16] [--duration 20] [--url http://host:port]
+
+Without ``--url`` a local uvicorn instance is started on a free port and stopped at
+the end. Each client loops over a dashboard-like mix of requests with randomized
+filters; only the standard library is used on the client side.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlencode, urlparse
+
+from timing import percentile
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+PRESETS = ["1m", "3m", "6m", "1y"]
+ENDPOINTS = [
+    ("/summary", {}),
+    ("/timeseries", {"granularity": "monthly"}),
+    ("/map", {"level": "state"}),
+    ("/map", {"level": "district"}),
+    ("/comparisons", {}),
+    ("/insights", {}),
+    ("/meta", None),
+]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(host: str, port: int, timeout: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=2)
+            conn.request("GET", "/health")
+            response = conn.getresponse()
+            if response.status == 200 and json.loads(response.read()).get("status") == "ok":
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    sys.exit("server did not come up")
+
+
+def client(
+    host: str,
+    port: int,
+    states: List[str],
+    stop: threading.Event,
+    results: Dict[str, List[float]],
+    errors: List[str],
+) -> None:
+    rng = random.Random()
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    while not stop.is_set():
+        path, extra = rng.choice(ENDPOINTS)
+        params = {}
+        if extra is not None:
+            params = {"preset": rng.choice(PRESETS), **extra}
+            if extra.get("level") == "district" or rng.random() < 0.5:
+                params["state"] = rng.choice(states)
+        label = path + (f"?level={extra['level']}" if extra and "level" in extra else "")
+        began = time.perf_counter()
+        try:
+            conn.request("GET", f"{path}?{urlencode(params)}" if params else path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(f"{label}: {response.status}")
+        except (OSError, http.client.HTTPException) as exc:
+            errors.append(f"{label}: {exc}")
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=60)
+            continue
+        results.setdefault(label, []).append((time.perf_counter() - began) * 1000)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="existing server to target instead of starting uvicorn")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers when starting a local server")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", host, "--port", str(port),
+             "--workers", str(args.workers), "--log-level", "warning"],
+            cwd=BACKEND_DIR,
+            env={**os.environ, "UIDAI_RELOAD_INTERVAL": "0"},
+        )
+    try:
+        wait_until_up(host, port)
+        conn = http.client.HTTPConnection(host, port, timeout=60)
+        conn.request("GET", "/meta")
+        states = json.loads(conn.getresponse().read())["states"] or [""]
+
+        results: Dict[str, List[float]] = {}
+        errors: List[str] = []
+        stop = threading.Event()
+        threads = [
+            threading.Thread(target=client, args=(host, port, states, stop, results, errors), daemon=True)
+            for _ in range(args.clients)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(args.duration)
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        total = sum(len(samples) for samples in results.values())
+        print(f"clients={args.clients} duration={args.duration:.0f}s requests={total} "
+              f"rps={total / args.duration:.1f} errors={len(errors)}")
+        print(f"{'endpoint':<26} {'n':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        everything = [sample for samples in results.values() for sample in samples]
+        for label, samples in sorted(results.items()) + [("all", everything)]:
+            print(f"{label:<26} {len(samples):>6} {percentile(samples, 50):>8.1f} "
+                  f"{percentile(samples, 95):>8.1f} {percentile(samples, 99):>8.1f}")
+        for error in errors[:5]:
+            print("error:", error)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,110 @@
+"""Generate schema-faithful synthetic enrolment, biometric and demographic CSVs.
+
+Usage (from the repo root):
+    python backend/benchmarks/synth_data.py OUT_DIR [--scale 10] [--days 365] [--seed 0]
+
+Writes ``OUT_DIR/api_data_aadhar_{enrolment,biometric,demographic}/*.csv`` in the layout of
+the UIDAI extracts, so ``UIDAI_DATA_DIR=OUT_DIR`` loads it like the real folders. Scale 1
+is the row count of the bundled extracts (biometric, which is not bundled, mirrors
+demographic). Every row is a (state, district, pincode) drawn from the bundled files,
+weighted by how often it appears there, so state/district/pincode cardinalities and the
+raw, uncleaned state spellings are realistic. Dates are spread uniformly over ``--days``
+days ending at ``--end``. Count columns are resampled row-wise from the bundled extracts
+(biometric reuses the demographic counts), keeping their skew and correlation.
+"""
+
+import argparse
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+# Dataset whose bundled rows supply the counts of each generated dataset.
+COUNT_SOURCE = {"enrol": "enrol", "bio": "demo", "demo": "demo"}
+KEY_COLUMNS = ["state", "district", "pincode"]
+
+
+def bundled(key: str) -> pd.DataFrame:
+    """Raw rows of the bundled extract for ``key`` (biometric falls back to demographic)."""
+    files = sorted((main.BASE_DIR / main.CSV_FOLDERS[key]).glob("*.csv"))
+    if not files and key == "bio":
+        return bundled("demo")
+    if not files:
+        raise SystemExit(f"no bundled CSVs under {main.CSV_FOLDERS[key]}/ to sample from")
+    return pd.concat([pd.read_csv(path, dtype={"state": str, "district": str}) for path in files], ignore_index=True)
+
+
+def generate(
+    out: Path, scale: float = 1.0, days: int = 365, end: str = "2025-12-31", seed: int = 0, rows_per_file: int = 500000
+) -> Dict[str, int]:
+    """Write every dataset under ``out`` and return the generated row count per dataset."""
+    rng = np.random.default_rng(seed)
+    sources = {key: bundled(key) for key in set(COUNT_SOURCE.values())}
+    areas = pd.concat(sources.values(), ignore_index=True)[KEY_COLUMNS].value_counts().reset_index()
+    weights = areas["count"].to_numpy(float) / areas["count"].sum()
+    labels = (pd.Timestamp(end) - pd.to_timedelta(np.arange(days), unit="D")).strftime("%d-%m-%Y").to_numpy()
+    counts = {}
+    for key, folder in main.CSV_FOLDERS.items():
+        source = sources[COUNT_SOURCE[key]]
+        rows = max(int(len(source) * scale), 1)
+        picked = areas.iloc[rng.choice(len(areas), size=rows, p=weights)].reset_index(drop=True)
+        frame = pd.DataFrame(
+            {
+                "date": labels[rng.integers(0, days, size=rows)],
+                "state": picked["state"],
+                "district": picked["district"],
+                "pincode": picked["pincode"],
+            }
+        )
+        samples = source[main.COUNT_COLUMNS[COUNT_SOURCE[key]]].fillna(0).astype(np.int64).to_numpy()
+        values = samples[rng.integers(0, len(samples), size=rows)]
+        for position, col in enumerate(main.COUNT_COLUMNS[key]):
+            frame[col] = values[:, position]
+
+        target = out / folder
+        target.mkdir(parents=True, exist_ok=True)
+        for lo in range(0, rows, rows_per_file):
+            hi = min(lo + rows_per_file, rows)
+            frame.iloc[lo:hi].to_csv(target / f"{folder}_{lo}_{hi}.csv", index=False)
+        counts[key] = rows
+    return counts
+
+
+def dataset_dir(root: Path, scale: float, days: int = 365, seed: int = 0) -> Path:
+    """``root/scale-S-days-D-seed-N``, generated on first use and reused on later runs."""
+    data_dir = root / f"scale-{scale:g}-days-{days}-seed-{seed}"
+    if not data_dir.exists():
+        started = time.perf_counter()
+        partial = data_dir.with_name(data_dir.name + ".partial")
+        shutil.rmtree(partial, ignore_errors=True)
+        generate(partial, scale, days, seed=seed)
+        partial.rename(data_dir)
+        print(f"generated scale {scale:g} in {time.perf_counter() - started:.1f}s")
+    return data_dir
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out", type=Path)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiple of the bundled row counts")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--end", default="2025-12-31", help="last date, YYYY-MM-DD")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rows-per-file", type=int, default=500000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = generate(args.out, args.scale, args.days, args.end, args.seed, args.rows_per_file)
+    print(f"{', '.join(f'{key}={rows}' for key, rows in counts.items())} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,29 @@
+"""Latency sampling and percentiles shared by the benchmark scripts."""
+
+import math
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile: the smallest sample with ``pct``% of all samples at or below it."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)), 1) - 1]
+
+
+def time_calls(call: Callable[[], object], repeat: int, before: Optional[Callable[[], object]] = None) -> List[float]:
+    """Milliseconds taken by each of ``repeat`` calls; ``before`` runs untimed ahead of every call."""
+    samples = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        began = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - began) * 1000)
+    return samples
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    return {"p50_ms": round(percentile(samples, 50), 3), "p95_ms": round(percentile(samples, 95), 3)}
@@ -1,14 +1,176 @@
+import asyncio
+import atexit
+import bisect
+import contextvars
+import copy
+import cProfile
+import functools
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
+import pstats
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
-from fastapi import FastAPI, Query
+from pandas.api.types import union_categoricals
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.datastructures import MutableHeaders
+
+try:  # optional: Arrow IPC snapshots of cleaned CSVs
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - cache disabled without pyarrow
+    feather = None
+
+try:  # optional: Parquet exports
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - /export offers CSV only
+    pa = pq = None
+
+try:  # optional: embedded SQL engine for UIDAI_QUERY_BACKEND=duckdb
+    import duckdb
+except ImportError:  # pragma: no cover - only the pandas backend is available
+    duckdb = None
+
+try:  # optional: orjson serializes payloads several times faster than the stdlib encoder
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as PayloadResponse
+except ImportError:  # pragma: no cover - stdlib json fallback
+    PayloadResponse = JSONResponse
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
+# Root holding the api_data_aadhar_* folders; defaults to the repository root.
+DATA_DIR = Path(os.environ.get("UIDAI_DATA_DIR", str(BASE_DIR)))
+
+# Cleaned CSV snapshots live here; set UIDAI_CACHE_DIR="" to disable the cache.
+CACHE_DIR = os.environ.get("UIDAI_CACHE_DIR", str(BASE_DIR / ".cache" / "csv"))
+# Bump whenever the cleaning rules or the snapshot layout change so stale snapshots are ignored.
+CACHE_VERSION = 4
+
+# In-process response cache: max entries and time-to-live in seconds.
+RESPONSE_CACHE_SIZE = int(os.environ.get("UIDAI_RESPONSE_CACHE_SIZE", "512"))
+RESPONSE_CACHE_TTL = float(os.environ.get("UIDAI_RESPONSE_CACHE_TTL", "900"))
+
+# Seconds between polls of the CSV folders for new or modified files (0 disables).
+RELOAD_INTERVAL = float(os.environ.get("UIDAI_RELOAD_INTERVAL", "60"))
+# Files modified more recently than this are assumed to still be written and are skipped.
+RELOAD_SETTLE_SECONDS = 2.0
+
+# Pool that runs DataStore queries off the event loop: "thread" or "process".
+COMPUTE_POOL = os.environ.get("UIDAI_COMPUTE_POOL", "thread")
+COMPUTE_WORKERS = int(os.environ.get("UIDAI_COMPUTE_WORKERS", str(min(8, os.cpu_count() or 1))))
+# Max concurrent computations per endpoint; further requests queue on the event loop.
+ENDPOINT_CONCURRENCY = int(os.environ.get("UIDAI_ENDPOINT_CONCURRENCY", "4"))
+
+# Seconds a request waits for the datasets it needs while the store is warming up.
+WARMUP_TIMEOUT = float(os.environ.get("UIDAI_WARMUP_TIMEOUT", "60"))
+
+# DataStore log level (DEBUG adds per-stage timings to every load and query).
+LOG_LEVEL = os.environ.get("UIDAI_LOG_LEVEL", "WARNING").upper()
+
+logger = logging.getLogger("uidai.datastore")
+logger.setLevel(LOG_LEVEL)
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+
+# Count columns per dataset; every endpoint aggregates these.
+COUNT_COLUMNS = {
+    "enrol": ["age_0_5", "age_5_17", "age_18_greater"],
+    "bio": ["bio_age_5_17", "bio_age_17_"],
+    "demo": ["demo_age_5_17", "demo_age_17_"],
+}
+
+# Count columns behind each ?stream=; "combined" reads the joined rollup of all three datasets.
+STREAM_COLUMNS = {**COUNT_COLUMNS, "combined": [col for columns in COUNT_COLUMNS.values() for col in columns]}
+# Columns counted as working-age (adult) activity in each stream.
+ADULT_COLUMNS = {"enrol": ["age_18_greater"], "bio": ["bio_age_17_"], "demo": ["demo_age_17_"]}
+ADULT_COLUMNS["combined"] = [col for columns in ADULT_COLUMNS.values() for col in columns]
+
+# Granularity of the per-dataset rollups; pincode is only kept in the raw frames.
+ROLLUP_KEYS = ["date", "state", "district"]
+
+# Low-cardinality keys stored as pandas Categorical so filters compare integer codes.
+CATEGORICAL_COLUMNS = ("state", "district")
+
+# Processes parsing CSV files in parallel on (re)load; 1 parses serially in-process.
+INGEST_WORKERS = int(os.environ.get("UIDAI_INGEST_WORKERS", "1"))
+
+# Responses smaller than this many bytes are sent uncompressed.
+GZIP_MIN_BYTES = int(os.environ.get("UIDAI_GZIP_MIN_BYTES", "1000"))
+
+# Rows per /export chunk: one CSV write or Parquet row group, bounding the memory of an export.
+EXPORT_CHUNK_ROWS = int(os.environ.get("UIDAI_EXPORT_CHUNK_ROWS", "50000"))
+
+# Per-request stage spans in a Server-Timing header; UIDAI_SERVER_TIMING=0 skips collecting them.
+SERVER_TIMING = os.environ.get("UIDAI_SERVER_TIMING", "1") != "0"
+# Whether ``?profile=1`` may return a cProfile breakdown instead of the payload. Off by
+# default: a profiled request skips the response cache and holds a process-wide lock.
+PROFILING = os.environ.get("UIDAI_PROFILING", "0") == "1"
+PROFILE_TOP_FUNCTIONS = 30
+# Upper bounds (seconds) of the /metrics request latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Fields of each /pincodes item, in response order.
+PINCODE_FIELDS = [
+    "pincode", "state", "district", "enrolment", "biometric", "demographic", "totalActivity", "migrationProxy"
+]
+
+# Annual births per state (CRS), the denominator of the enrolment intensity ratio in /risk.
+CRS_BIRTHS = {
+    "Uttar Pradesh": 4500000, "Bihar": 3200000, "Maharashtra": 1800000,
+    "West Bengal": 1400000, "Rajasthan": 1600000, "Delhi": 350000,
+    "Tamil Nadu": 900000, "Gujarat": 1100000, "Karnataka": 1000000,
+    "Odisha": 700000, "Andhra Pradesh": 800000, "Telangana": 600000,
+    "Kerala": 450000, "Madhya Pradesh": 1500000, "Haryana": 550000,
+}
+CRS_DEFAULT_BIRTHS = 500000
+# (tier, minimum IRI, colour), checked in order.
+RISK_TIERS = [("CRITICAL", 6.0, "#ff6b6b"), ("MEDIUM", 3.0, "#ffd93d"), ("LOW", -np.inf, "#51cf66")]
+
+# /anomalies: a week is flagged when |z| against its trailing baseline reaches ANOMALY_Z.
+ANOMALY_Z = float(os.environ.get("UIDAI_ANOMALY_Z", "3.0"))
+ANOMALY_BASELINE_WEEKS = 8
+ANOMALY_MIN_WEEKS = 4  # fewer baseline weeks than this give no z-score
+ROLLING_GROWTH_WEEKS = 4  # rolling growth: last N weeks vs. the N weeks before
+
+# Quick presets whose responses are precomputed for the nation and every state after
+# each (re)load; UIDAI_MATERIALIZE=0 serves them through the live path only.
+MATERIALIZED_PRESETS = ("1m", "3m", "6m", "1y") if os.environ.get("UIDAI_MATERIALIZE", "1") != "0" else ()
+
+# Multi-worker mode: workers share memory-mapped DataState segments under this directory.
+# One worker loads the CSVs and publishes segments; the others attach read-only.
+SHARED_DIR = os.environ.get("UIDAI_SHARED_DIR", "")
+SHARED_POLL_SECONDS = float(os.environ.get("UIDAI_SHARED_POLL_SECONDS", "1.0"))
+SHARED_KEEP_SEGMENTS = 3
+SHARED_MIN_BYTES = 4096  # smaller arrays stay inside the segment pickle
+
+# Engine behind /summary, /timeseries, /map, /comparisons and /insights: "pandas" (rollup
+# indexes and running totals) or "duckdb" (embedded SQL over the cleaned pincode rows).
+QUERY_BACKEND = os.environ.get("UIDAI_QUERY_BACKEND", "pandas")
+
+# Rows per read_csv chunk; bounds the transient memory of parsing a single file.
+CHUNK_ROWS = int(os.environ.get("UIDAI_CHUNK_ROWS", "250000"))
 
 CSV_FOLDERS = {
     "enrol": "api_data_aadhar_enrolment",
@@ -39,6 +201,56 @@ STATE_NORMALIZATION = {
 }
 
 
+# Sentinel for lookups where None is a valid cached value.
+_MISSING = object()
+# Spans collected for the request being served by this thread or task (see collect_stages).
+_request_spans: contextvars.ContextVar[Optional[List[Tuple[str, float]]]] = contextvars.ContextVar(
+    "uidai_request_spans", default=None
+)
+
+
+@contextmanager
+def log_stage(stage: str, **fields: object) -> Iterator[None]:
+    """Time a DataStore stage: logged at DEBUG and recorded as a span of the current request.
+
+    A no-op unless DEBUG logging is on or the stage runs under ``collect_stages``.
+    """
+    spans = _request_spans.get()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if spans is None and not debug:
+        yield
+        return
+    began = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - began) * 1000
+        if spans is not None:
+            spans.append((stage, elapsed_ms))
+        if debug:
+            details = " ".join(f"{key}={value}" for key, value in fields.items())
+            logger.debug("stage=%s elapsed_ms=%.2f %s", stage, elapsed_ms, details)
+
+
+@contextmanager
+def collect_stages(enabled: bool = True) -> Iterator[Optional[List[Tuple[str, float]]]]:
+    """Record the ``(stage, elapsed_ms)`` spans of every ``log_stage`` in this thread/task."""
+    spans: Optional[List[Tuple[str, float]]] = [] if enabled else None
+    token = _request_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _request_spans.reset(token)
+
+
+def server_timing(spans: List[Tuple[str, float]]) -> str:
+    """``Server-Timing`` header value; repeated stages are summed."""
+    totals: Dict[str, float] = {}
+    for stage, elapsed_ms in spans:
+        totals[stage] = totals.get(stage, 0.0) + elapsed_ms
+    return ", ".join(f"{stage};dur={elapsed_ms:.2f}" for stage, elapsed_ms in totals.items())
+
+
 def clean_state_name(name: str) -> str:
     s = str(name).lower().strip()
     s = s.replace("&", "and")
@@ -58,20 +270,428 @@ def parse_date(value: Optional[str]) -> Optional[pd.Timestamp]:
 def resolve_window(
     preset: Optional[str], start: Optional[str], end: Optional[str], max_date: pd.Timestamp
 ) -> Tuple[pd.Timestamp, pd.Timestamp]:
-    if preset == "1m":
-        start_date = max_date - timedelta(days=30)
-    elif preset == "3m":
-        start_date = max_date - timedelta(days=90)
-    elif preset == "6m":
-        start_date = max_date - timedelta(days=180)
-    elif preset == "1y":
-        start_date = max_date - timedelta(days=365)
-    else:
-        start_dt = parse_date(start)
-        end_dt = parse_date(end)
-        start_date = start_dt or (max_date - timedelta(days=90))
-        max_date = end_dt or max_date
-    return start_date, max_date
+    with log_stage("window", preset=preset):
+        if preset == "1m":
+            start_date = max_date - timedelta(days=30)
+        elif preset == "3m":
+            start_date = max_date - timedelta(days=90)
+        elif preset == "6m":
+            start_date = max_date - timedelta(days=180)
+        elif preset == "1y":
+            start_date = max_date - timedelta(days=365)
+        else:
+            start_dt = parse_date(start)
+            end_dt = parse_date(end)
+            start_date = start_dt or (max_date - timedelta(days=90))
+            max_date = end_dt or max_date
+        return start_date, max_date
+
+
+def normalize_states(states: pd.Series) -> pd.Series:
+    """Apply ``clean_state_name`` once per distinct value and broadcast the result back."""
+    uniques = states.unique()
+    return states.map(dict(zip(uniques, (clean_state_name(value) for value in uniques))))
+
+
+def clean_frame(df: pd.DataFrame, columns: List[str] = ()) -> pd.DataFrame:
+    """Normalize state names, parse dd-mm-yyyy dates and narrow column dtypes.
+
+    Key columns become categoricals, ``pincode`` and the count ``columns`` become int32
+    (missing or malformed values are counted as 0, matching how sums skip NaN).
+    """
+    df["state"] = normalize_states(df["state"])
+    df = df.loc[~df["state"].str.isnumeric()].copy()
+    df["date"] = pd.to_datetime(df["date"], dayfirst=True, errors="coerce")
+    df = df.dropna(subset=["date"]).reset_index(drop=True)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype("category").cat.remove_unused_categories()
+    for col in [*columns, "pincode"]:
+        if col in df:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(np.int32)
+    return df
+
+
+def read_clean_csv(path: Path, columns: List[str]) -> pd.DataFrame:
+    """Stream ``path`` in chunks, cleaning and pre-aggregating each one before the next is read.
+
+    Chunks are reduced to one row per (date, state, district, pincode) holding the count
+    ``columns``, so peak memory tracks the cleaned result rather than the raw text.
+    """
+    keys = [*ROLLUP_KEYS, "pincode"]
+    parts = []
+    for chunk in pd.read_csv(path, chunksize=CHUNK_ROWS, dtype={"state": str, "district": "category"}):
+        chunk = clean_frame(chunk, columns)
+        present = [col for col in columns if col in chunk]
+        if chunk.empty or "pincode" not in chunk:
+            continue
+        reduced = chunk.groupby(keys, observed=True, dropna=False, sort=False)[present].sum()
+        parts.append(reduced.astype(np.int32).reset_index())
+    return concat_frames(parts) if parts else pd.DataFrame()
+
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate cleaned frames, unioning categories so key columns stay categorical."""
+    if len(frames) == 1:
+        return frames[0]
+    df = pd.concat(frames, ignore_index=True)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            parts = [frame[col].astype("category") for frame in frames if col in frame]
+            if len(parts) == len(frames):
+                df[col] = union_categoricals(parts, sort_categories=True)
+    return df
+
+
+def write_arrow(df: pd.DataFrame, path: Path) -> None:
+    """Atomically write ``df`` as one uncompressed Arrow record batch, the layout ``read_arrow`` maps."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    feather.write_feather(df, tmp, compression="uncompressed", chunksize=max(len(df), 1))
+    tmp.replace(path)
+
+
+def read_arrow(path: Path) -> pd.DataFrame:
+    """Memory-map a ``write_arrow`` file: with one batch and one block per column, no column is copied."""
+    return feather.read_feather(path, memory_map=True, split_blocks=True)
+
+
+class SnapshotCache:
+    """Arrow IPC snapshots of cleaned CSV files, keyed by source path, size and mtime.
+
+    Snapshots are single uncompressed record batches, so a warm read maps the file and
+    its columns are read-only views of the page cache; a source file that changes on
+    disk gets a new key, and unreferenced snapshots are pruned.
+    Each folder also keeps one merged snapshot of its index-ready pincode frame, keyed by
+    every file in it.
+    """
+
+    def __init__(self, root: Optional[str]) -> None:
+        self.root = Path(root) if root and feather is not None else None
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None
+
+    @staticmethod
+    def key(path: Path) -> str:
+        stat = path.stat()
+        raw = f"{CACHE_VERSION}|{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _snapshot_path(self, folder: str, path: Path) -> Path:
+        return self.root / folder / f"{path.stem}-{self.key(path)[:16]}.arrow"
+
+    def _merged_path(self, folder: str, paths: List[Path]) -> Path:
+        raw = "|".join(sorted(self.key(path) for path in paths))
+        return self.root / folder / f"merged-{hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]}.arrow"
+
+    def read_merged(self, folder: str, paths: List[Path]) -> Optional[pd.DataFrame]:
+        """The frame ``write_merged`` stored for exactly ``paths``, memory-mapped, or None."""
+        if not self.enabled or not paths:
+            return None
+        snapshot = self._merged_path(folder, paths)
+        if not snapshot.exists():
+            return None
+        try:
+            return read_arrow(snapshot)
+        except Exception:  # pragma: no cover - corrupt snapshot, rebuilt from the files
+            snapshot.unlink(missing_ok=True)
+            return None
+
+    def write_merged(self, folder: str, paths: List[Path], df: pd.DataFrame) -> None:
+        if not self.enabled or not paths:
+            return
+        snapshot = self._merged_path(folder, paths)
+        try:
+            snapshot.parent.mkdir(parents=True, exist_ok=True)
+            write_arrow(df, snapshot)
+        except Exception:  # pragma: no cover - unwritable cache dir; warm starts regroup instead
+            pass
+
+    def has(self, folder: str, path: Path) -> bool:
+        return self.enabled and self._snapshot_path(folder, path).exists()
+
+    def target(self, folder: str, path: Path, scratch: Path) -> Path:
+        """Where a pool worker should write the cleaned frame for ``path``."""
+        if self.enabled:
+            return self._snapshot_path(folder, path)
+        return scratch / folder / f"{path.stem}-{hashlib.sha1(str(path).encode('utf-8')).hexdigest()[:16]}.arrow"
+
+    def read(self, folder: str, path: Path, columns: List[str]) -> Tuple[pd.DataFrame, bool, Optional[Path]]:
+        """Return the cleaned frame for ``path`` and whether it came from the cache."""
+        if not self.enabled:
+            return read_clean_csv(path, columns), False, None
+
+        snapshot = self._snapshot_path(folder, path)
+        if snapshot.exists():
+            try:
+                return read_arrow(snapshot), True, snapshot
+            except Exception:  # pragma: no cover - corrupt snapshot, rebuild below
+                snapshot.unlink(missing_ok=True)
+
+        df = read_clean_csv(path, columns)
+        try:
+            snapshot.parent.mkdir(parents=True, exist_ok=True)
+            write_arrow(df, snapshot)
+        except Exception:  # pragma: no cover - unwritable cache dir or unconvertible column
+            return df, False, None
+        return df, False, snapshot
+
+    def prune(self, folder: str, sources: List[Path]) -> None:
+        """Drop snapshots for files that changed or disappeared since they were written."""
+        if not self.enabled or not (self.root / folder).is_dir():
+            return
+        existing = [path for path in sources if path.exists()]
+        keep_names = {self._snapshot_path(folder, path).name for path in existing}
+        if existing:
+            keep_names.add(self._merged_path(folder, existing).name)
+        for snapshot in (self.root / folder).glob("*.arrow"):
+            if snapshot.name not in keep_names:
+                snapshot.unlink(missing_ok=True)
+
+
+def ingest_to_arrow(path: str, columns: List[str], target: str) -> str:
+    """Ingest-pool task: clean one CSV and write it as an uncompressed Arrow IPC file.
+
+    Only the file name travels back to the parent, which memory-maps the result instead
+    of unpickling a DataFrame.
+    """
+    df = read_clean_csv(Path(path), columns)
+    out = Path(target)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    write_arrow(df, out)
+    return target
+
+
+def build_rollup(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Collapse pincode-level rows to one row per (date, state, district)."""
+    if df.empty:
+        return df
+    columns = [col for col in columns if col in df]
+    return df.groupby(ROLLUP_KEYS, observed=True, dropna=False)[columns].sum().reset_index()
+
+
+def sort_order(df: pd.DataFrame, columns: List[str]) -> Optional[np.ndarray]:
+    """Stable argsort of ``df`` by ``columns``, or None when its rows are already in that order."""
+    order = df[columns].reset_index(drop=True).sort_values(columns, kind="stable").index.to_numpy()
+    return None if (order[1:] > order[:-1]).all() else order
+
+
+class WindowIndex:
+    """Rollup rows ordered by ``(*keys, date)`` with the row range of every key.
+
+    The rows stay in the rollup frame: ``order`` is the permutation into ``(*keys, date)``
+    order, or None when the frame is already in it, so every index over one rollup shares
+    a single frame. A window lookup is a dict hit plus two ``searchsorted`` calls on the
+    date column. Running totals of the count columns turn the sum over any row range into
+    one subtraction.
+    """
+
+    def __init__(self, df: pd.DataFrame, keys: List[str]) -> None:
+        self.keys = keys
+        self.columns = [col for col in df.columns if col not in (*ROLLUP_KEYS, *keys)]
+        self.frame = df
+        self.order: Optional[np.ndarray] = None
+        if df.empty:
+            self.dates = np.array([], dtype="datetime64[ns]")
+            self.bounds: Dict[Tuple, Tuple[int, int]] = {}
+            self.cumsum = np.zeros((1, len(self.columns)), dtype=np.int64)
+            return
+        self.order = sort_order(df, [*keys, "date"])
+        ordered = df if self.order is None else df.take(self.order)
+        self.dates = ordered["date"].to_numpy()
+        # Leading zero row: rows [first, last) sum to cumsum[last] - cumsum[first].
+        self.cumsum = np.zeros((len(df) + 1, len(self.columns)), dtype=np.int64)
+        np.cumsum(ordered[self.columns].to_numpy(dtype=np.int64), axis=0, out=self.cumsum[1:])
+        self.bounds = {(): (0, len(df))}
+        if keys:
+            # Each key owns one run of rows; a run starts wherever any key column changes.
+            key_frame = ordered[keys]
+            changed = np.zeros(len(df), dtype=bool)
+            changed[0] = True
+            for key in keys:
+                codes = pd.factorize(key_frame[key])[0]
+                changed[1:] |= codes[1:] != codes[:-1]
+            starts = np.flatnonzero(changed)
+            ends = np.append(starts[1:], len(df))
+            self.bounds = {
+                key: (int(first), int(last))
+                for key, first, last in zip(key_frame.iloc[starts].itertuples(index=False, name=None), starts, ends)
+            }
+
+    def rows(self, ranges: List[Tuple[int, int]]) -> pd.DataFrame:
+        """Frame rows over ``ranges`` of index positions; one range of an ordered frame is a zero-copy slice."""
+        if self.order is None:
+            parts = [self.frame.iloc[first:last] for first, last in ranges]
+            if len(parts) == 1:
+                return parts[0]
+            return pd.concat(parts) if parts else self.frame.iloc[0:0]
+        positions = [self.order[first:last] for first, last in ranges]
+        return self.frame.take(np.concatenate(positions) if positions else np.array([], dtype=np.int64))
+
+    def span(self, key: Tuple, start: pd.Timestamp, end: pd.Timestamp) -> Tuple[int, int]:
+        """Row range ``[first, last)`` of ``key`` with ``start <= date <= end``."""
+        lo, hi = self.bounds.get(key, (0, 0))
+        dates = self.dates[lo:hi]
+        first = lo + int(dates.searchsorted(start.to_datetime64(), side="left"))
+        last = lo + int(dates.searchsorted(end.to_datetime64(), side="right"))
+        return first, last
+
+    def slice(self, key: Tuple, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """Rows for ``key`` with ``start <= date <= end``."""
+        return self.rows([self.span(key, start, end)])
+
+    def totals(self, first: int, last: int) -> np.ndarray:
+        """Sum of every count column over rows ``[first, last)``."""
+        return self.cumsum[last] - self.cumsum[first]
+
+    def month_totals(self, first: int, last: int, month: np.datetime64) -> np.ndarray:
+        """Sum of every count column over the rows in ``[first, last)`` dated in ``month``."""
+        edges = np.array([month, month + 1]).astype(self.dates.dtype)
+        lo, hi = first + self.dates[first:last].searchsorted(edges, side="left")
+        return self.totals(int(lo), int(hi))
+
+    def month_of(self, row: int) -> np.datetime64:
+        return self.dates[row].astype("datetime64[M]")
+
+
+def join_rollups(rollups: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """One rollup per (date, state, district) holding the count columns of every dataset."""
+    frames = [rollups[key] for key in COUNT_COLUMNS if not rollups.get(key, pd.DataFrame()).empty]
+    if not frames:
+        return pd.DataFrame()
+    joined = build_rollup(concat_frames(frames), STREAM_COLUMNS["combined"])
+    for col in STREAM_COLUMNS["combined"]:
+        joined[col] = joined[col].fillna(0).astype(np.int64) if col in joined else np.int64(0)
+    return joined
+
+
+def build_indexes(rollup: pd.DataFrame) -> List[WindowIndex]:
+    """Window indexes for national, state and district lookups (in that order)."""
+    return [WindowIndex(rollup, ROLLUP_KEYS[1:depth]) for depth in (1, 2, 3)]
+
+
+class PincodeIndex(WindowIndex):
+    """Pincode-level rows ordered state → district → pincode → date.
+
+    Every state and district owns a contiguous run of pincode groups, so a drilldown
+    touches only its run. The window bounds of all pincodes in a run come from one
+    vectorized ``searchsorted`` on a ``(group, day)`` composite key.
+    """
+
+    KEYS = ["state", "district", "pincode"]
+
+    def __init__(self, df: pd.DataFrame, grouped: bool = False) -> None:
+        """``grouped``: ``df`` is already one row per (pincode, date) in index order, like ``frame``."""
+        if not df.empty and not grouped:
+            columns = [col for col in df.columns if col not in (*ROLLUP_KEYS, "pincode")]
+            df = df.groupby([*self.KEYS, "date"], observed=True, dropna=False)[columns].sum().reset_index()
+        super().__init__(df, self.KEYS)
+        if df.empty:
+            self.groups: List[Tuple] = []
+            self.group_keys = pd.DataFrame(columns=self.KEYS)
+            self.runs: Dict[Tuple, Tuple[int, int]] = {}
+            return
+        self.groups = sorted(self.bounds, key=lambda key: self.bounds[key][0])
+        starts = np.array([self.bounds[key][0] for key in self.groups])
+        sizes = np.array([self.bounds[key][1] - self.bounds[key][0] for key in self.groups])
+        self.group_keys = self.frame[self.KEYS].iloc[starts].reset_index(drop=True)
+        days = self.dates.astype("datetime64[D]").astype(np.int64)
+        self.first_day = int(days.min())
+        self.span_days = int(days.max()) - self.first_day + 1
+        group_ids = np.repeat(np.arange(len(self.groups), dtype=np.int64), sizes)
+        self.composite = group_ids * self.span_days + (days - self.first_day)
+        self.runs = {}
+        for position, (state, district, _) in enumerate(self.groups):
+            for parent in ((state,), (state, district)):
+                first, _ = self.runs.get(parent, (position, position))
+                self.runs[parent] = (first, position + 1)
+
+    def window_totals(self, parents: Optional[List[Tuple]], start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """Per-column totals of each pincode under ``parents`` that has rows in the window.
+
+        ``parents`` are ``(state,)`` or ``(state, district)`` keys; ``None`` means every pincode.
+        """
+        if not self.groups:
+            return self.group_keys.copy()
+        runs = [(0, len(self.groups))] if parents is None else [self.runs[p] for p in parents if p in self.runs]
+        group_ids = np.concatenate([np.arange(*run, dtype=np.int64) for run in runs] or [np.array([], np.int64)])
+        first_offset = min(max(self._day(start.ceil("D")) - self.first_day, 0), self.span_days)
+        last_offset = min(max(self._day(end.floor("D")) - self.first_day, -1), self.span_days - 1)
+        base = group_ids * self.span_days
+        first = self.composite.searchsorted(base + first_offset, side="left")
+        last = self.composite.searchsorted(base + last_offset, side="right")
+        present = last > first
+        totals = self.cumsum[last[present]] - self.cumsum[first[present]]
+        keys = self.group_keys.iloc[group_ids[present]].reset_index(drop=True)
+        return pd.concat([keys, pd.DataFrame(totals, columns=self.columns)], axis=1)
+
+    def row_ranges(self, parents: Optional[List[Tuple]]) -> List[Tuple[int, int]]:
+        """Frame row ranges holding every pincode under ``parents`` (``None``: all rows)."""
+        if not self.groups:
+            return []
+        if parents is None:
+            return [(0, len(self.frame))]
+        ranges = []
+        for parent in parents:
+            if parent in self.runs:
+                first, last = self.runs[parent]
+                ranges.append((self.bounds[self.groups[first]][0], self.bounds[self.groups[last - 1]][1]))
+        return ranges
+
+    @staticmethod
+    def _day(value: pd.Timestamp) -> int:
+        return int(value.to_datetime64().astype("datetime64[D]").astype(np.int64))
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with a per-entry TTL for computed API payloads."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]) -> object:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+
+        value = compute()
+        if self.maxsize <= 0:
+            return value
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
 
 
 def calc_growth(series: pd.Series) -> float:
@@ -85,74 +705,1085 @@ def calc_growth(series: pd.Series) -> float:
     return round(((last - first) / first) * 100, 2)
 
 
+def trailing_zscores(weekly: np.ndarray, baseline: int, min_weeks: int) -> Tuple[np.ndarray, np.ndarray]:
+    """z-score of every column of ``weekly`` against up to ``baseline`` preceding columns.
+
+    Rolling sums come from cumulative sums along the time axis, so all groups and weeks
+    are scored in one pass. Returns ``(z, expected)``; z is 0 where the baseline is shorter
+    than ``min_weeks`` or flat.
+    """
+    groups, weeks = weekly.shape
+    sums = np.zeros((groups, weeks + 1))
+    squares = np.zeros((groups, weeks + 1))
+    np.cumsum(weekly, axis=1, out=sums[:, 1:])
+    np.cumsum(weekly.astype(float) ** 2, axis=1, out=squares[:, 1:])
+    ends = np.arange(weeks)
+    starts = np.maximum(ends - baseline, 0)
+    counts = (ends - starts).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = (sums[:, ends] - sums[:, starts]) / counts
+        variance = (squares[:, ends] - squares[:, starts]) / counts - expected**2
+    std = np.sqrt(np.clip(variance, 0, None))
+    valid = (counts >= min_weeks) & (std > 1e-9)
+    z = np.divide(weekly - expected, std, out=np.zeros(weekly.shape), where=valid)
+    return z, np.where(counts > 0, expected, 0.0)
+
+
+def summary_payload(
+    totals: Dict[str, int],
+    months: List[Tuple[int, int]],
+    group_adult: np.ndarray,
+    group_total: np.ndarray,
+    state: Optional[str],
+    window: Tuple[pd.Timestamp, pd.Timestamp],
+    last_refreshed: datetime,
+) -> Dict[str, object]:
+    """/summary KPIs from aggregates any query backend can produce.
+
+    ``totals`` holds the window total of every count column, ``months`` the enrolment
+    ``(adult, total)`` of the window's first and last month (empty without rows), and
+    ``group_adult``/``group_total`` the same per state (per district with a district filter).
+    """
+    window_start, window_end = window
+    enrol_total, bio_total, demo_total = (
+        sum(totals.get(col, 0) for col in COUNT_COLUMNS[key]) for key in ("enrol", "bio", "demo")
+    )
+    adult_share = (totals["age_18_greater"] / enrol_total) if enrol_total else 0
+    combined_total = float(enrol_total + bio_total + demo_total)
+
+    average_growth = 0.0
+    if months:
+        shares = [adult / month_total if month_total > 0 else 0 for adult, month_total in months]
+        average_growth = float(calc_growth(pd.Series(shares)))
+
+    states_signal = 0
+    if not state and len(group_total):
+        shares = np.divide(group_adult, group_total, out=np.zeros(len(group_adult)), where=group_total > 0)
+        threshold = 0.52  # heuristic: adult share > 52% indicates migration-like signal
+        states_signal = round((int((shares > threshold).sum()) / max(len(shares), 1)) * 100, 2)
+
+    return {
+        "totalActivity": int(combined_total),
+        "adultSharePct": round(adult_share * 100, 2),
+        "statesSignal": states_signal,
+        "averageGrowth": round(average_growth, 2),
+        "statesCovered": len(group_total),
+        "window": {"start": window_start.date().isoformat(), "end": window_end.date().isoformat()},
+        "lastRefreshed": last_refreshed.isoformat(),
+    }
+
+
+def timeseries_payload(rows: pd.DataFrame, granularity: str, stream: str = "enrol") -> List[Dict[str, object]]:
+    """Adult share and activity per period of ``rows`` (a ``date`` column plus the stream's counts).
+
+    ``rows`` may be daily rollup rows or already bucketed per period; empty periods inside
+    the range are reported with zero activity.
+    """
+    if rows.empty:
+        logger.debug("timeseries: no %s rows in window", stream)
+        return []
+
+    freq_map = {"monthly": "ME", "quarterly": "QE", "yearly": "YE"}
+    freq = freq_map.get(granularity, "ME")
+
+    with log_stage("timeseries.resample", rows=len(rows), freq=freq, stream=stream):
+        grouped = rows.set_index("date")[STREAM_COLUMNS[stream]].resample(freq).sum()
+        total = grouped.sum(axis=1).to_numpy()
+        adult = grouped[ADULT_COLUMNS[stream]].sum(axis=1).to_numpy()
+        adult_share = np.divide(adult, total, out=np.zeros(len(total)), where=total > 0)
+
+    with log_stage("timeseries.serialize", points=len(grouped)):
+        return [
+            {"date": date, "adultShare": share, "totalActivity": activity}
+            for date, share, activity in zip(
+                grouped.index.strftime("%Y-%m-%d").tolist(),
+                np.round(adult_share * 100, 2).tolist(),
+                total.astype(np.int64).tolist(),
+            )
+        ]
+
+
+def map_payload(
+    keys: List[Tuple],
+    level: str,
+    total_activity: np.ndarray,
+    adult: np.ndarray,
+    first: np.ndarray,
+    last: np.ndarray,
+) -> List[Dict[str, object]]:
+    """Map rows for ``(state,)`` or ``(state, district)`` groups, most adult-heavy first.
+
+    ``first`` and ``last`` are each group's adult activity in its first and last month
+    in the window. Ties keep the order of ``keys``.
+    """
+    adult_share = np.divide(adult, total_activity, out=np.zeros(len(adult)), where=total_activity > 0)
+    migration_proxy = np.round(adult_share * 100, 2)
+    growth = np.round(np.divide(last - first, first, out=np.zeros(len(first)), where=first != 0) * 100, 2)
+
+    rows = []
+    for key, proxy, growth_pct, activity in zip(keys, migration_proxy, growth, total_activity):
+        state_name = key[0]
+        if level == "district":
+            district_name = key[1]
+            name = f"{district_name}, {state_name}"
+            identifier = district_name
+        else:  # level == "state"
+            name = state_name
+            identifier = state_name
+
+        rows.append(
+            {
+                "id": identifier,
+                "state": state_name,
+                "name": name,
+                "migrationProxy": float(proxy),
+                "growthPct": float(growth_pct),
+                "totalActivity": int(activity),
+            }
+        )
+
+    rows = sorted(rows, key=lambda r: r["migrationProxy"], reverse=True)
+    return rows
+
+
+# Fields of the map and timeseries /export views, so an export with no rows still has a header.
+AGGREGATE_EXPORT_FIELDS = {
+    "map": ["id", "state", "name", "migrationProxy", "growthPct", "totalActivity"],
+    "timeseries": ["date", "adultShare", "totalActivity"],
+}
+
+
+def frame_chunks(
+    frame: pd.DataFrame,
+    ranges: List[Tuple[int, int]],
+    columns: List[str],
+    window: Optional[Tuple[pd.Timestamp, pd.Timestamp]] = None,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+    order: Optional[np.ndarray] = None,
+) -> Iterator[pd.DataFrame]:
+    """``columns`` of ``frame`` over row ``ranges``, at most ``chunk_rows`` rows at a time.
+
+    With ``window``, rows dated outside it are dropped chunk by chunk, for frames that are
+    not sorted by date. ``ranges`` index into ``order`` when given (a ``WindowIndex.order``).
+    """
+    dates = frame["date"].to_numpy() if window is not None else None
+    if dates is not None and order is not None:
+        dates = dates[order]
+    for first, last in ranges:
+        for lo in range(first, last, chunk_rows):
+            hi = min(lo + chunk_rows, last)
+            chunk = frame.iloc[lo:hi] if order is None else frame.take(order[lo:hi])
+            if dates is not None:
+                inside = (dates[lo:hi] >= window[0].to_datetime64()) & (dates[lo:hi] <= window[1].to_datetime64())
+                chunk = chunk[inside]
+            if len(chunk):
+                yield chunk[columns]
+
+
+def csv_stream(frames: Iterator[pd.DataFrame], columns: List[str], compress: bool = False) -> Iterator[bytes]:
+    """CSV bytes, one piece per frame after the header row; one gzip stream with ``compress``."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits 31: gzip container
+
+    def pieces() -> Iterator[bytes]:
+        yield (",".join(columns) + "\n").encode()
+        for frame in frames:
+            yield frame.to_csv(index=False, header=False, date_format="%Y-%m-%d").encode()
+
+    for piece in pieces():
+        piece = compressor.compress(piece) if compressor else piece
+        if piece:
+            yield piece
+    if compressor:
+        yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an ``Accept-Encoding`` value allows gzip: named, or matched by ``*``, with q > 0."""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, *params = (piece.strip() for piece in part.split(";"))
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if coding:
+            weights[coding.lower()] = weight
+    return weights.get("gzip", weights.get("x-gzip", weights.get("*", 0.0))) > 0
+
+
+class _DrainedSink:
+    """Write-only file object whose buffered bytes are handed out by ``drain``."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self._pieces: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._pieces.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data, self._pieces = b"".join(self._pieces), []
+        return data
+
+
+def parquet_stream(frames: Iterator[pd.DataFrame], columns: List[str]) -> Iterator[bytes]:
+    """A Parquet file written one row group per frame, yielded as each group is written."""
+    sink, writer = _DrainedSink(), None
+    for frame in frames:
+        table = pa.Table.from_pandas(frame, schema=writer.schema if writer else None, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(sink, table.schema)
+        writer.write_table(table)
+        yield sink.drain()
+    if writer is None:  # no rows: still a valid file with the requested columns
+        writer = pq.ParquetWriter(sink, pa.schema([(col, pa.string()) for col in columns]))
+    writer.close()
+    yield sink.drain()
+
+
+def list_csv_files(folder: str) -> List[Path]:
+    return list((DATA_DIR / folder).glob("*.csv")) + list(Path(".").glob(f"{folder}*.csv"))
+
+
+def file_signature(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+class DataState:
+    """One generation of loaded data. DataStore publishes a new instance on every (re)load."""
+
+    def __init__(self, generation: int, previous: Optional["DataState"] = None) -> None:
+        self.generation = generation
+        self.datasets: Dict[str, pd.DataFrame] = dict(previous.datasets) if previous else {}
+        self.rollups: Dict[str, pd.DataFrame] = dict(previous.rollups) if previous else {}
+        self.indexes: Dict[str, List[WindowIndex]] = dict(previous.indexes) if previous else {}
+        self.pincode_indexes: Dict[str, PincodeIndex] = dict(previous.pincode_indexes) if previous else {}
+        self.files: Dict[str, Dict[Path, Tuple[int, int]]] = dict(previous.files) if previous else {}
+        self.health: Dict[str, str] = dict(previous.health) if previous else {}
+        self.cache_stats: Dict[str, Dict[str, int]] = dict(previous.cache_stats) if previous else {}
+        self.state_to_district: Dict[str, List[str]] = dict(previous.state_to_district) if previous else {}
+        self.min_date: pd.Timestamp = previous.min_date if previous else pd.Timestamp("1900-01-01")
+        self.max_date: pd.Timestamp = previous.max_date if previous else pd.Timestamp("1900-01-01")
+        self.ready: Set[str] = set(previous.ready) if previous else set()
+        self.last_refreshed: datetime = datetime.utcnow()
+        # Preset-window responses computed in the background once this generation is published.
+        self.materialized: Dict[Hashable, object] = {}
+        self.materialized_complete = False
+
+
+class _SegmentPickler(pickle.Pickler):
+    """Pickles a DataState with every large array written to its own ``.npy`` file."""
+
+    def __init__(self, file, directory: Path) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.directory = directory
+        self.saved: Dict[int, Tuple[str, np.ndarray]] = {}
+
+    def persistent_id(self, obj: object) -> Optional[str]:
+        if type(obj) is not np.ndarray or obj.dtype.hasobject or obj.nbytes < SHARED_MIN_BYTES:
+            return None
+        if id(obj) not in self.saved:  # keep obj referenced so its id is not reused
+            name = f"{len(self.saved)}.npy"
+            np.save(self.directory / name, obj, allow_pickle=False)
+            self.saved[id(obj)] = (name, obj)
+        return self.saved[id(obj)][0]
+
+
+class _SegmentUnpickler(pickle.Unpickler):
+    def __init__(self, file, directory: Path) -> None:
+        super().__init__(file)
+        self.directory = directory
+
+    def persistent_load(self, pid: str) -> np.ndarray:
+        return np.load(self.directory / pid, mmap_mode="r").view(np.ndarray)
+
+
+class SharedSegments:
+    """Generation-numbered, memory-mapped DataState snapshots shared between processes.
+
+    The leader (holder of ``leader.lock``) exports every DataState it publishes as a
+    segment: large arrays as ``.npy`` files plus a pickle that refers to them. Followers
+    map the arrays read-only, so every worker shares one copy through the page cache.
+    ``CURRENT`` names the newest segment and is swapped atomically.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock_file = None
+
+    @property
+    def leader(self) -> bool:
+        return self._lock_file is not None
+
+    def try_lead(self) -> bool:
+        """Become the loading process unless another live process already is."""
+        if self._lock_file is None:
+            import fcntl  # POSIX only, like the multi-worker servers this mode targets
+
+            handle = open(self.root / "leader.lock", "w")
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                handle.close()
+                return False
+            self._lock_file = handle  # held until the process exits
+        return True
+
+    def export(self, data: "DataState") -> str:
+        name = f"gen-{data.generation:08d}-{os.getpid()}"
+        tmp = self.root / f".{name}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+        snapshot = copy.copy(data)
+        snapshot.materialized, snapshot.materialized_complete = {}, False  # recomputed per process
+        with open(tmp / "state.pkl", "wb") as handle:
+            _SegmentPickler(handle, tmp).dump(snapshot)
+        tmp.replace(self.root / name)
+        pointer = self.root / ".CURRENT.tmp"
+        pointer.write_text(name)
+        pointer.replace(self.root / "CURRENT")
+        self.prune(name)
+        return name
+
+    def current(self) -> Optional[str]:
+        try:
+            return (self.root / "CURRENT").read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def attach(self, name: str) -> "DataState":
+        directory = self.root / name
+        with open(directory / "state.pkl", "rb") as handle:
+            return _SegmentUnpickler(handle, directory).load()
+
+    def prune(self, current: str) -> None:
+        """Drop all but the newest segments; processes still mapping them keep their pages."""
+        segments = sorted((path for path in self.root.glob("gen-*") if path.name != current), reverse=True)
+        for path in segments[SHARED_KEEP_SEGMENTS - 1 :]:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+class QueryBackend(ABC):
+    """Computes uncached /summary, /timeseries and /map results for a resolved window.
+
+    ``DataStore`` resolves presets, caches, materializes and derives /comparisons and
+    /insights from the state-level map rows; a backend only aggregates the DataState the
+    calling query is pinned to (``store.current``). Payloads are finished by
+    ``summary_payload``, ``timeseries_payload`` and ``map_payload`` so every backend
+    rounds and orders identically.
+    """
+
+    name = ""
+
+    def prepare(self, data: "DataState") -> None:
+        """Called with every DataState ``DataStore`` publishes, before queries can reach it."""
+
+    @abstractmethod
+    def summary(
+        self, store: "DataStore", state: Optional[str], district: Optional[str], window: Tuple[pd.Timestamp, pd.Timestamp]
+    ) -> Dict[str, object]:
+        ...
+
+    @abstractmethod
+    def timeseries(
+        self,
+        store: "DataStore",
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        granularity: str,
+        stream: str,
+    ) -> List[Dict[str, object]]:
+        ...
+
+    @abstractmethod
+    def map_view(
+        self,
+        store: "DataStore",
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        level: str,
+        stream: str = "enrol",
+    ) -> List[Dict[str, object]]:
+        ...
+
+
+class PandasBackend(QueryBackend):
+    """Window indexes and running totals over the in-memory rollups (the default)."""
+
+    name = "pandas"
+
+    def summary(self, store, state, district, window):
+        return store._summary(state, district, window)
+
+    def timeseries(self, store, state, district, window, granularity, stream):
+        return timeseries_payload(store._filter_df(stream, state, district, *window), granularity, stream)
+
+    def map_view(self, store, state, district, window, level, stream="enrol"):
+        return store._map_view(state, district, window, level, stream)
+
+
+class DuckDBBackend(QueryBackend):
+    """Embedded DuckDB over views of each generation's in-memory pincode frames, registered without copying."""
+
+    name = "duckdb"
+    UNITS = {"monthly": "month", "quarterly": "quarter", "yearly": "year"}
+
+    def __init__(self) -> None:
+        if duckdb is None:
+            raise RuntimeError("UIDAI_QUERY_BACKEND=duckdb needs the duckdb package")
+        self._lock = threading.Condition()
+        self._database: Optional[Tuple[DataState, "duckdb.DuckDBPyConnection", threading.local]] = None
+        self._active = 0
+        self._closed = False
+        atexit.register(self.close)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Wait for running queries and hold back new ones (run at exit).
+
+        DuckDB aborts the process if the interpreter exits while a daemon thread (such as
+        the materializer) is inside a query. After ``close`` such threads park on the lock
+        until the process ends.
+        """
+        with self._lock:
+            self._closed = True
+            self._lock.wait_for(lambda: not self._active, timeout)
+            self._database = None
+
+    def prepare(self, data: DataState) -> None:
+        with log_stage("duckdb.register", generation=data.generation):
+            db = self._connect(data)
+        with self._lock:
+            if self._database is None or self._database[0].generation <= data.generation:
+                self._database = (data, db, threading.local())
+
+    def _connect(self, data: DataState) -> "duckdb.DuckDBPyConnection":
+        db = duckdb.connect(":memory:")
+        self._register(db, data)  # the views bind to these names; cursors register them again
+        for key, columns in COUNT_COLUMNS.items():
+            frame = data.datasets.get(key, pd.DataFrame())
+            if frame.empty:
+                counts = ", ".join(f"NULL::INTEGER AS {col}" for col in columns)
+                db.execute(
+                    f"CREATE VIEW {key} AS SELECT NULL::TIMESTAMP AS date, NULL::VARCHAR AS state, "
+                    f"NULL::VARCHAR AS district, {counts} WHERE false"
+                )
+                continue
+            counts = ", ".join(col if col in frame else f"0::INTEGER AS {col}" for col in columns)
+            db.execute(
+                f"CREATE VIEW {key} AS SELECT date::TIMESTAMP AS date, state::VARCHAR AS state, "
+                f"district::VARCHAR AS district, {counts} FROM {key}_rows"
+            )
+        selects = [
+            "SELECT date, state, district, "
+            + ", ".join(col if col in columns else f"0 AS {col}" for col in STREAM_COLUMNS["combined"])
+            + f" FROM {key}"
+            for key, columns in COUNT_COLUMNS.items()
+        ]
+        db.execute("CREATE VIEW combined AS " + " UNION ALL ".join(selects))
+        return db
+
+    @staticmethod
+    def _register(db: "duckdb.DuckDBPyConnection", data: DataState) -> None:
+        for key in COUNT_COLUMNS:
+            frame = data.datasets.get(key)
+            if frame is not None and not frame.empty:
+                db.register(f"{key}_rows", frame)
+
+    def _query(self, store: "DataStore", sql: str, params: List[object]) -> pd.DataFrame:
+        data = store.current
+        with self._lock:
+            self._lock.wait_for(lambda: not self._closed)
+            database = self._database
+            self._active += 1
+        try:
+            if database is None or database[0] is not data:
+                # Pinned to a generation that was superseded before it got here: query a
+                # throwaway database over its frames, which costs no copy either.
+                database = (data, self._connect(data), threading.local())
+            cursors = database[2]  # registrations are per connection: one cursor per thread
+            if getattr(cursors, "cursor", None) is None:
+                cursors.cursor = database[1].cursor()
+                self._register(cursors.cursor, data)
+            with log_stage("duckdb.query"):
+                return cursors.cursor.execute(sql, params).df()
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._lock.notify_all()
+
+    @staticmethod
+    def _where(
+        state: Optional[str], district: Optional[str], window: Tuple[pd.Timestamp, pd.Timestamp]
+    ) -> Tuple[str, List[object]]:
+        clauses, params = ["date BETWEEN ? AND ?"], [window[0].to_pydatetime(), window[1].to_pydatetime()]
+        for column, value in (("state", state), ("district", district)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    @staticmethod
+    def _sum(columns: List[str]) -> str:
+        return " + ".join(columns)
+
+    def summary(self, store, state, district, window):
+        where, params = self._where(state, district, window)
+        combined = STREAM_COLUMNS["combined"]
+        totals = self._query(
+            store,
+            "SELECT " + ", ".join(f"coalesce(sum({col}), 0)::BIGINT AS {col}" for col in combined)
+            + f" FROM combined WHERE {where}",
+            params,
+        )
+        enrol_total = self._sum(COUNT_COLUMNS["enrol"])
+        months = self._query(
+            store,
+            f"""
+            WITH rows AS (
+                SELECT date_trunc('month', date) AS month, age_18_greater AS adult, {enrol_total} AS total
+                FROM enrol WHERE {where}
+            )
+            SELECT sum(adult)::BIGINT AS adult, sum(total)::BIGINT AS total FROM rows
+            WHERE month = (SELECT min(month) FROM rows) OR month = (SELECT max(month) FROM rows)
+            GROUP BY month ORDER BY month
+            """,
+            params,
+        )
+        groups = self._query(  # per state, or per (state, district) under a district filter
+            store,
+            f"SELECT sum(age_18_greater)::BIGINT AS adult, sum({enrol_total})::BIGINT AS total FROM enrol "
+            f"WHERE {where} AND state IS NOT NULL GROUP BY state{', district' if district else ''}",
+            params,
+        )
+        month_rows = list(months.itertuples(index=False, name=None))
+        return summary_payload(
+            totals.iloc[0].to_dict(),
+            month_rows * 2 if len(month_rows) == 1 else month_rows,  # one month is both first and last
+            groups["adult"].to_numpy(np.int64),
+            groups["total"].to_numpy(np.int64),
+            state,
+            window,
+            store.last_refreshed,
+        )
+
+    def timeseries(self, store, state, district, window, granularity, stream):
+        where, params = self._where(state, district, window)
+        unit = self.UNITS.get(granularity, "month")
+        columns = STREAM_COLUMNS[stream]
+        buckets = self._query(
+            store,
+            f"SELECT date_trunc('{unit}', date)::TIMESTAMP AS date, "
+            + ", ".join(f"sum({col})::BIGINT AS {col}" for col in columns)
+            + f" FROM {stream} WHERE {where} GROUP BY 1 ORDER BY 1",
+            params,
+        )
+        return timeseries_payload(buckets, granularity, stream)
+
+    def map_view(self, store, state, district, window, level, stream="enrol"):
+        where, params = self._where(state, district, window)
+        keys = ["state", "district"] if district or level == "district" else ["state"]
+        key_list = ", ".join(keys)
+        present = " AND ".join(f"{key} IS NOT NULL" for key in keys)
+        rows = self._query(
+            store,
+            f"""
+            WITH rows AS (
+                SELECT {key_list}, date_trunc('month', date) AS month,
+                       {self._sum(ADULT_COLUMNS[stream])} AS adult, {self._sum(STREAM_COLUMNS[stream])} AS total
+                FROM {stream} WHERE {where} AND {present}
+            ), bounds AS (
+                SELECT {key_list}, min(month) AS first_month, max(month) AS last_month FROM rows GROUP BY {key_list}
+            )
+            SELECT {key_list}, sum(total)::BIGINT AS total, sum(adult)::BIGINT AS adult,
+                   sum(CASE WHEN month = first_month THEN adult ELSE 0 END)::DOUBLE AS first,
+                   sum(CASE WHEN month = last_month THEN adult ELSE 0 END)::DOUBLE AS last
+            FROM rows JOIN bounds USING ({key_list})
+            GROUP BY {key_list} ORDER BY {key_list}
+            """,
+            params,
+        )
+        if rows.empty:
+            return []
+        return map_payload(
+            list(rows[keys].astype(object).itertuples(index=False, name=None)),
+            level,
+            rows["total"].to_numpy(np.int64),
+            rows["adult"].to_numpy(np.int64),
+            rows["first"].to_numpy(float),
+            rows["last"].to_numpy(float),
+        )
+
+
+QUERY_BACKENDS: Dict[str, Callable[[], QueryBackend]] = {"pandas": PandasBackend, "duckdb": DuckDBBackend}
+
+
+def pinned(method: Callable) -> Callable:
+    """Run a query against the DataState current at entry, even if a reload swaps it midway."""
+
+    stage = f"query.{method.__name__}"
+
+    @functools.wraps(method)
+    def wrapper(self: "DataStore", *args, **kwargs):
+        if getattr(self._local, "state", None) is not None:
+            return method(self, *args, **kwargs)
+        self._local.state = self._state
+        try:
+            with log_stage(stage):
+                return method(self, *args, **kwargs)
+        finally:
+            self._local.state = None
+
+    return wrapper
+
+
 class DataStore:
     """Loads, cleans, and aggregates UIDAI datasets for API responses."""
 
     def __init__(self) -> None:
-        self.datasets: Dict[str, pd.DataFrame] = {}
-        self.health: Dict[str, str] = {}
-        self.state_to_district: Dict[str, List[str]] = {}
-        self.min_date: pd.Timestamp = pd.Timestamp("1900-01-01")
-        self.max_date: pd.Timestamp = pd.Timestamp("1900-01-01")
-        self.last_refreshed: datetime = datetime.utcnow()
-        self._load()
+        self.cache = SnapshotCache(CACHE_DIR)
+        self.responses = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+        self._state = DataState(0)
+        self._local = threading.local()
+        self._reload_lock = threading.Lock()
+        self._ready_changed = threading.Condition()
+        self._loader: Optional[threading.Thread] = None
+        self.shared = SharedSegments(Path(SHARED_DIR)) if SHARED_DIR else None
+        self._attached: Optional[str] = None
+        self.backend = QUERY_BACKENDS[QUERY_BACKEND]()
+
+    @property
+    def current(self) -> DataState:
+        return getattr(self._local, "state", None) or self._state
+
+    datasets = property(lambda self: self.current.datasets)
+    rollups = property(lambda self: self.current.rollups)
+    indexes = property(lambda self: self.current.indexes)
+    pincode_indexes = property(lambda self: self.current.pincode_indexes)
+    health = property(lambda self: self.current.health)
+    cache_stats = property(lambda self: self.current.cache_stats)
+    state_to_district = property(lambda self: self.current.state_to_district)
+    min_date = property(lambda self: self.current.min_date)
+    max_date = property(lambda self: self.current.max_date)
+    last_refreshed = property(lambda self: self.current.last_refreshed)
+
+    def _ingest_in_pool(self, jobs: Dict[str, List[Path]], scratch: Path) -> Dict[Path, "Future[str]"]:
+        """Parse snapshot-cache misses across ``INGEST_WORKERS`` processes.
+
+        Returns a future per file yielding the Arrow file its worker wrote. Files are
+        submitted in dataset order, so enrolment finishes first.
+        """
+        misses = [
+            (key, path) for key, files in jobs.items() for path in files if not self.cache.has(CSV_FOLDERS[key], path)
+        ]
+        if INGEST_WORKERS <= 1 or feather is None or len(misses) < 2:
+            return {}
+        # spawn, not fork: the loader runs on a background thread of a threaded server.
+        executor = ProcessPoolExecutor(
+            max_workers=min(INGEST_WORKERS, len(misses)), mp_context=multiprocessing.get_context("spawn")
+        )
+        futures = {
+            path: executor.submit(
+                ingest_to_arrow, str(path), COUNT_COLUMNS[key], str(self.cache.target(CSV_FOLDERS[key], path, scratch))
+            )
+            for key, path in misses
+        }
+        executor.shutdown(wait=False)
+        return futures
 
-    def _load_csv_folder(self, folder: str) -> pd.DataFrame:
-        full_path = BASE_DIR / folder
-        files = list(full_path.glob("*.csv")) + list(Path(".").glob(f"{folder}*.csv"))
+    def _read_files(
+        self, data: DataState, key: str, files: List[Path], pending: Optional[Dict[Path, "Future[str]"]] = None
+    ) -> pd.DataFrame:
+        folder = CSV_FOLDERS[key]
         if not files:
-            self.health[folder] = "no_data"
+            data.health[folder] = "no_data"
             return pd.DataFrame()
 
         try:
-            df = pd.concat([pd.read_csv(path, low_memory=False) for path in files], ignore_index=True)
-            df["state"] = df["state"].apply(clean_state_name)
-            df = df[~df["state"].str.isnumeric()]
-            df["date"] = pd.to_datetime(df["date"], dayfirst=True, errors="coerce")
-            df = df.dropna(subset=["date"])
-            self.health[folder] = f"ok:{len(files)}"
-            return df
+            frames = []
+            stats = {"hits": 0, "misses": 0}
+            for path in files:
+                if pending and path in pending:
+                    frame, hit = read_arrow(Path(pending[path].result())), False
+                else:
+                    frame, hit, _ = self.cache.read(folder, path, COUNT_COLUMNS[key])
+                frames.append(frame)
+                stats["hits" if hit else "misses"] += 1
+            self.cache.prune(folder, list(data.files.get(folder, files)))
+            data.cache_stats[folder] = stats
+            return concat_frames(frames)
         except Exception as exc:  # pragma: no cover - defensive
-            self.health[folder] = f"error:{exc}"
+            data.health[folder] = f"error:{exc}"
             return pd.DataFrame()
 
-    def _load(self) -> None:
-        for key, folder in CSV_FOLDERS.items():
-            self.datasets[key] = self._load_csv_folder(folder)
-
-        enrol = self.datasets.get("enrol", pd.DataFrame())
-        if not enrol.empty:
-            self.min_date = enrol["date"].min()
-            self.max_date = enrol["date"].max()
-            self.state_to_district = {
-                state: sorted(enrol[enrol["state"] == state]["district"].dropna().unique().tolist())
-                for state in sorted(enrol["state"].unique())
-            }
-        self.last_refreshed = datetime.utcnow()
+    def _load_dataset(
+        self,
+        data: DataState,
+        key: str,
+        files: List[Path],
+        append: bool = False,
+        pending: Optional[Dict[Path, "Future[str]"]] = None,
+    ) -> pd.DataFrame:
+        """Read ``files`` into ``data`` (added to the existing rows with ``append``).
+
+        ``pending`` holds files already being parsed by the ingest pool. Returns the
+        rollup of the rows that were just read.
+        """
+        folder = CSV_FOLDERS[key]
+        data.health.pop(folder, None)
+        with log_stage("load.read", dataset=key, files=len(files), append=append):
+            merged = None if append else self.cache.read_merged(folder, files)
+            if merged is not None:  # warm start: the index-ready frame, no per-file reads or regroup
+                data.cache_stats[folder] = {"hits": len(files), "misses": 0}
+                fresh = merged
+            else:
+                fresh = self._read_files(data, key, files, pending)
+        with log_stage("load.rollup", dataset=key):
+            added = build_rollup(fresh, COUNT_COLUMNS[key])
+            rows, rollup = fresh, added
+            previous = data.rollups.get(key, pd.DataFrame())
+            if append and not previous.empty:
+                rows, rollup = data.datasets[key], previous
+                if not added.empty:
+                    rows = concat_frames([rows, fresh])
+                    rollup = build_rollup(concat_frames([previous, added]), COUNT_COLUMNS[key])
+        data.rollups[key] = rollup
+        with log_stage("load.index", dataset=key):
+            data.indexes[key] = build_indexes(rollup)
+            if rows is not data.datasets.get(key):
+                data.pincode_indexes.pop(key, None)
+                if "pincode" in rows:
+                    data.pincode_indexes[key] = PincodeIndex(rows, grouped=merged is not None)
+                    if merged is None:
+                        rows = data.pincode_indexes[key].frame  # same rows, merged per (pincode, date) and sorted
+                        self.cache.write_merged(folder, list(data.files.get(folder, files)), rows)
+        data.datasets[key] = rows
+        if folder not in data.health:
+            data.health[folder] = f"ok:{len(data.files[folder])}" if data.files.get(folder) else "no_data"
+        logger.info(
+            "loaded dataset=%s files=%d rows=%d rollup_rows=%d status=%s",
+            key,
+            len(files),
+            len(rows),
+            len(rollup),
+            data.health[folder],
+        )
+        return added
+
+    @staticmethod
+    def _join(data: DataState) -> None:
+        """Rebuild the combined rollup and its indexes from the per-dataset rollups."""
+        with log_stage("load.join"):
+            data.rollups["combined"] = join_rollups(data.rollups)
+            data.indexes["combined"] = build_indexes(data.rollups["combined"])
+
+    @staticmethod
+    def _merge_meta(data: DataState, enrol: pd.DataFrame) -> None:
+        """Fold new enrolment rollup rows into the date bounds and state -> district lookup."""
+        if enrol.empty:
+            return
+        first, last = enrol["date"].min(), enrol["date"].max()
+        if data.state_to_district:
+            first, last = min(first, data.min_date), max(last, data.max_date)
+        data.min_date, data.max_date = first, last
+
+        lookup = dict(data.state_to_district)
+        for state, districts in enrol.groupby("state", observed=True)["district"]:
+            known = set(lookup.get(state, []))
+            lookup[state] = sorted(known.union(districts.dropna().unique().tolist()))
+        data.state_to_district = dict(sorted(lookup.items()))
+
+    def _publish(self, data: DataState) -> None:
+        self.backend.prepare(data)
+        with self._ready_changed:
+            self._state = data
+            self.responses.clear()
+            self._ready_changed.notify_all()
+        if self.shared is not None and self.shared.leader:
+            with log_stage("shared.export", generation=data.generation):
+                self._attached = self.shared.export(data)
+        if MATERIALIZED_PRESETS and data.ready.issuperset(CSV_FOLDERS):
+            threading.Thread(target=self._materialize, args=(data,), name="materialize", daemon=True).start()
+
+    def load(self) -> None:
+        """Load every dataset, enrolment first.
+
+        On a cold start each dataset is published as soon as it is ready, so enrolment-only
+        endpoints can answer before the larger folders are parsed. A reload of an
+        already-warm store publishes once at the end.
+        """
+        with self._reload_lock, self._scratch() as scratch:
+            progressive = not self._state.ready
+            data = DataState(self._state.generation + 1, self._state if progressive else None)
+            jobs = {key: list_csv_files(folder) for key, folder in CSV_FOLDERS.items()}
+            pending = self._ingest_in_pool(jobs, scratch)
+            for key, folder in CSV_FOLDERS.items():
+                files = jobs[key]
+                data.files[folder] = {path: file_signature(path) for path in files}
+                self._load_dataset(data, key, files, pending=pending)
+                if key == "enrol":
+                    self._merge_meta(data, data.rollups.get("enrol", pd.DataFrame()))
+                data.ready.add(key)
+                if data.ready.issuperset(CSV_FOLDERS):  # "combined" is only served once all are ready
+                    self._join(data)
+                if progressive:
+                    self._publish(data)
+                    data = DataState(data.generation + 1, data)
+            if not progressive:
+                self._publish(data)
+
+    @contextmanager
+    def _scratch(self) -> Iterator[Path]:
+        """Temporary directory for ingest-pool output when the snapshot cache is disabled."""
+        path = Path(tempfile.mkdtemp(prefix="uidai-ingest-"))
+        try:
+            yield path
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
 
     def reload(self) -> None:
-        self._load()
+        self.load()
+
+    def start_loading(self) -> None:
+        """Load in the background; check readiness with ``is_ready`` / ``wait_ready``."""
+        if self._loader is None:
+            target = self._follow if self.shared is not None and not self.shared.try_lead() else self.load
+            self._loader = threading.Thread(target=target, name="datastore-loader", daemon=True)
+            self._loader.start()
+
+    def attach(self) -> bool:
+        """Shared-mode follower: switch to the leader's newest segment. Returns whether it changed."""
+        name = self.shared.current()
+        if name is None or name == self._attached:
+            return False
+        with self._reload_lock, log_stage("shared.attach", segment=name):
+            data = self.shared.attach(name)
+            self._attached = name
+            self._publish(data)
+        logger.info("attached segment=%s generation=%d", name, data.generation)
+        return True
+
+    def _follow(self) -> None:
+        """Follow the leader's segments until this process wins the lock, then take over."""
+        while not self.shared.try_lead():
+            try:
+                self.attach()
+            except Exception:  # pragma: no cover - segment pruned mid-attach; retry next poll
+                logger.exception("attach failed")
+            time.sleep(SHARED_POLL_SECONDS)
+        logger.info("leader lock acquired; loading from CSVs")
+        if not self.is_ready():
+            self.load()
+
+    def is_ready(self, *keys: str) -> bool:
+        ready = self._state.ready
+        return all(key in ready for key in (keys or CSV_FOLDERS))
+
+    def wait_ready(self, *keys: str, timeout: Optional[float] = None) -> bool:
+        with self._ready_changed:
+            return self._ready_changed.wait_for(lambda: self.is_ready(*keys), timeout=timeout)
+
+    def refresh(self, settle: float = RELOAD_SETTLE_SECONDS) -> bool:
+        """Ingest only new or modified CSVs and publish the result as a new DataState.
+
+        New files are appended to the existing frames. A file that was modified or removed
+        rebuilds its dataset, re-reading unchanged files from their Arrow snapshots. Returns
+        whether anything changed.
+        """
+        with self._reload_lock, self._scratch() as scratch:
+            current = self._state
+            cutoff = time.time_ns() - int(settle * 1e9)
+            data: Optional[DataState] = None
+            rebuilt_enrol, added_enrol = False, None
+            for key, folder in CSV_FOLDERS.items():
+                known = current.files.get(folder, {})
+                seen = {}
+                for path in list_csv_files(folder):
+                    signature = file_signature(path)
+                    if signature[1] > cutoff:  # still being written; look again on the next poll
+                        if path in known:
+                            seen[path] = known[path]
+                        continue
+                    seen[path] = signature
+                if seen == known:
+                    continue
+                data = data or DataState(current.generation + 1, current)
+                data.files[folder] = seen
+                added = [path for path in seen if path not in known]
+                if any(path not in seen or seen[path] != sig for path, sig in known.items()):
+                    files = list(seen)
+                    self._load_dataset(data, key, files, pending=self._ingest_in_pool({key: files}, scratch))
+                    rebuilt_enrol = rebuilt_enrol or key == "enrol"
+                else:
+                    pending = self._ingest_in_pool({key: added}, scratch)
+                    rollup = self._load_dataset(data, key, added, append=True, pending=pending)
+                    if key == "enrol":
+                        added_enrol = rollup
+            if data is None:
+                return False
+            if rebuilt_enrol:
+                data.state_to_district = {}
+                self._merge_meta(data, data.rollups.get("enrol", pd.DataFrame()))
+            elif added_enrol is not None:
+                self._merge_meta(data, added_enrol)
+            self._join(data)
+            self._publish(data)
+            return True
+
+    def start_watching(self, interval: float = RELOAD_INTERVAL) -> None:
+        """Poll the CSV folders every ``interval`` seconds on a daemon thread."""
+        if interval <= 0 or getattr(self, "_watcher", None) is not None:
+            return
+        self._stop_watching = threading.Event()
+        self._watcher = threading.Thread(target=self._watch, args=(interval,), name="csv-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        watcher = getattr(self, "_watcher", None)
+        if watcher is None:
+            return
+        self._stop_watching.set()
+        watcher.join(timeout=5)
+        self._watcher = None
+
+    def _watch(self, interval: float) -> None:
+        self.wait_ready()
+        while not self._stop_watching.wait(interval):
+            if self.shared is not None and not self.shared.leader:
+                continue  # followers pick up the leader's reloads via attach()
+            try:
+                if self.refresh():
+                    logger.info("refreshed generation=%d", self._state.generation)
+            except Exception:  # pragma: no cover - keep polling after a bad file
+                logger.exception("refresh failed")
+
+    def _cached(
+        self,
+        name: str,
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        compute: Callable[[], object],
+        *extra: Hashable,
+    ) -> object:
+        """Memoize ``compute`` on the resolved window so presets and explicit dates share entries."""
+        if getattr(self._local, "uncached", False):  # profiled request: always run the computation
+            return compute()
+        key = (name, state or None, district or None, *window, *extra)
+        materialized = self.current.materialized.get(key, _MISSING)
+        if materialized is not _MISSING:
+            return materialized
+        target = getattr(self._local, "materialize", None)
+        if target is not None:  # materializer thread: keep the result out of the LRU
+            target[key] = compute()
+            return target[key]
+        return self.responses.get_or_compute((self.current.generation, *key), compute)
+
+    def _materialize(self, data: DataState) -> None:
+        """Precompute every preset for the nation and each state into ``data.materialized``.
+
+        Stops early if a newer generation is published meanwhile; that one gets its own run.
+        """
+        self._local.state = data
+        self._local.materialize = data.materialized
+        try:
+            with log_stage("materialize", generation=data.generation):
+                for preset in MATERIALIZED_PRESETS:
+                    for state in (None, *data.state_to_district):
+                        if self._state is not data:
+                            return
+                        self.summary(state, None, preset, None, None)
+                        self.working_age_timeseries(state, None, preset, None, None, "monthly")
+                        for level in ("state", "district") if state else ("state",):
+                            self.map_view(state, None, preset, None, None, level)
+                        self.comparisons(state, None, preset, None, None)
+                        self.insights(state, None, preset, None, None)
+            data.materialized_complete = True
+            logger.info("materialized generation=%d entries=%d", data.generation, len(data.materialized))
+        except Exception:  # pragma: no cover - requests fall back to the live path
+            logger.exception("materialize failed generation=%d", data.generation)
+        finally:
+            self._local.state = None
+            self._local.materialize = None
+
+    def _spans(
+        self,
+        key: str,
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        level: Optional[str] = None,
+    ) -> Tuple[Optional[WindowIndex], List[Tuple[Tuple, int, int]]]:
+        """Index plus the non-empty ``(key, first, last)`` row ranges matching the filters.
+
+        Without ``level`` the ranges cover every filtered row. With ``level`` there is one
+        range per map group ("state" or "district"), skipping groups with a missing name.
+        """
+        indexes = self.indexes.get(key)
+        if not indexes or indexes[0].frame.empty:
+            return None, []
+        if district or level == "district":
+            index = indexes[2]
+            if state and district:
+                keys = [(state, district)]
+            elif state or district:
+                position = 1 if district else 0
+                keys = [k for k in index.bounds if k[position] == (district or state)]
+            else:
+                keys = list(index.bounds)
+        elif state:
+            index, keys = indexes[1], [(state,)]
+        elif level:
+            index = indexes[1]
+            keys = list(index.bounds)
+        else:
+            index, keys = indexes[0], [()]
+        if level:  # groupby order: sorted by category code, which is the index row order
+            keys = [k for k in keys if not any(pd.isna(part) for part in k)]
+            keys.sort(key=lambda k: index.bounds.get(k, (0, 0))[0])
+        spans = [(k, *index.span(k, *window)) for k in keys]
+        return index, [span for span in spans if span[2] > span[1]]
 
     def _filter_df(
-        self, df: pd.DataFrame, state: Optional[str], district: Optional[str], start: pd.Timestamp, end: pd.Timestamp
+        self, key: str, state: Optional[str], district: Optional[str], start: pd.Timestamp, end: pd.Timestamp
     ) -> pd.DataFrame:
-        if df.empty:
-            return df
-        mask = (df["date"] >= start) & (df["date"] <= end)
-        if state:
-            mask &= df["state"] == state
-        if district:
-            mask &= df["district"] == district
-        return df.loc[mask].copy()
-
-    def _enrol_totals(self, df: pd.DataFrame) -> Tuple[float, float]:
-        if df.empty:
-            return 0.0, 0.0
-        totals = df[["age_0_5", "age_5_17", "age_18_greater"]].sum()
-        total_activity = totals.sum()
-        adult_share = (totals["age_18_greater"] / total_activity) if total_activity else 0
-        return total_activity, adult_share
-
+        with log_stage("filter", dataset=key):
+            index, spans = self._spans(key, state, district, (start, end))
+            if index is None:
+                return self.rollups.get(key, pd.DataFrame())
+            return index.rows([(first, last) for _, first, last in spans])
+
+    def _window_totals(
+        self, key: str, state: Optional[str], district: Optional[str], window: Tuple[pd.Timestamp, pd.Timestamp]
+    ) -> Dict[str, int]:
+        """Per-column totals of ``key`` over the filtered window, from the running totals."""
+        index, spans = self._spans(key, state, district, window)
+        if index is None:
+            return {}
+        totals = sum((index.totals(first, last) for _, first, last in spans), np.zeros(len(index.columns), np.int64))
+        return dict(zip(index.columns, totals))
+
+    @pinned
     def summary(
         self,
         state: Optional[str],
@@ -164,59 +1795,40 @@ class DataStore:
         if self.max_date is pd.NaT:  # pragma: no cover - empty data safety
             return {"totalActivity": 0, "statesSignal": 0, "averageGrowth": 0, "statesCovered": 0}
 
-        window_start, window_end = resolve_window(preset, start, end, self.max_date)
+        window = resolve_window(preset, start, end, self.max_date)
+        return self._summary_for(state, district, window)
 
-        enrol = self._filter_df(self.datasets["enrol"], state, district, window_start, window_end)
-        bio = self._filter_df(self.datasets["bio"], state, district, window_start, window_end)
-        demo = self._filter_df(self.datasets["demo"], state, district, window_start, window_end)
+    def _summary_for(
+        self, state: Optional[str], district: Optional[str], window: Tuple[pd.Timestamp, pd.Timestamp]
+    ) -> Dict[str, object]:
+        return self._cached("summary", state, district, window, lambda: self.backend.summary(self, state, district, window))
 
-        enrol_total, adult_share = self._enrol_totals(enrol)
-        bio_total = bio[["bio_age_5_17", "bio_age_17_"]].sum().sum() if not bio.empty else 0
-        demo_total = demo[["demo_age_5_17", "demo_age_17_"]].sum().sum() if not demo.empty else 0
-        combined_total = float(enrol_total + bio_total + demo_total)
+    def _summary(
+        self, state: Optional[str], district: Optional[str], window: Tuple[pd.Timestamp, pd.Timestamp]
+    ) -> Dict[str, object]:
+        """KPIs from the running totals: no row in the window is scanned."""
+        with log_stage("summary.totals", state=state, district=district):
+            totals = self._window_totals("combined", state, district, window)
 
         # Growth: compare first vs last month adult activity
-        growth_values = []
-        if not enrol.empty:
-            monthly = (
-                enrol.set_index("date")
-                .resample("M")[["age_18_greater", "age_0_5", "age_5_17"]]
-                .sum()
-                .reset_index()
-            )
-            monthly["adult_share"] = np.where(
-                monthly[["age_0_5", "age_5_17", "age_18_greater"]].sum(axis=1) > 0,
-                monthly["age_18_greater"] / monthly[["age_0_5", "age_5_17", "age_18_greater"]].sum(axis=1),
-                0,
-            )
-            growth_values = monthly.groupby(lambda idx: True)["adult_share"].apply(calc_growth).tolist()
-
-        states_data = []
-        if not state and enrol is not None and not enrol.empty:
-            for st in enrol["state"].unique():
-                st_df = enrol[enrol["state"] == st]
-                st_total, st_share = self._enrol_totals(st_df)
-                states_data.append({"state": st, "share": st_share, "total": st_total})
-
-        states_signal = 0
-        if states_data:
-            threshold = 0.52  # heuristic: adult share > 52% indicates migration-like signal
-            states_signal = round(
-                (len([s for s in states_data if s["share"] > threshold]) / max(len(states_data), 1)) * 100, 2
-            )
-
-        average_growth = float(np.mean(growth_values)) if growth_values else 0.0
-
-        return {
-            "totalActivity": int(combined_total),
-            "adultSharePct": round(adult_share * 100, 2),
-            "statesSignal": states_signal,
-            "averageGrowth": round(average_growth, 2),
-            "statesCovered": enrol["state"].nunique() if not enrol.empty else 0,
-            "window": {"start": window_start.date().isoformat(), "end": window_end.date().isoformat()},
-            "lastRefreshed": self.last_refreshed.isoformat(),
-        }
-
+        months = []
+        index, spans = self._spans("enrol", state, district, window)
+        if spans:
+            adult_col = index.columns.index("age_18_greater")
+            first_month = min(index.month_of(first) for _, first, _ in spans)
+            last_month = max(index.month_of(last - 1) for _, _, last in spans)
+            for month in (first_month, last_month):
+                month_totals = sum(index.month_totals(first, last, month) for _, first, last in spans)
+                months.append((month_totals[adult_col], month_totals.sum()))
+
+        index, groups = self._spans("enrol", state, district, window, level="state")
+        group_adult = group_total = np.zeros(0, np.int64)
+        if groups:
+            per_group = np.array([index.totals(first, last) for _, first, last in groups])
+            group_adult, group_total = per_group[:, index.columns.index("age_18_greater")], per_group.sum(axis=1)
+        return summary_payload(totals, months, group_adult, group_total, state, window, self.last_refreshed)
+
+    @pinned
     def working_age_timeseries(
         self,
         state: Optional[str],
@@ -225,41 +1837,228 @@ class DataStore:
         start: Optional[str],
         end: Optional[str],
         granularity: str,
+        stream: str = "enrol",
     ) -> List[Dict[str, object]]:
         if self.max_date is pd.NaT:
             return []
 
-        window_start, window_end = resolve_window(preset, start, end, self.max_date)
-        enrol = self._filter_df(self.datasets["enrol"], state, district, window_start, window_end)
-        if enrol.empty:
-            print("Enrol DataFrame is empty after filtering.")
+        window = resolve_window(preset, start, end, self.max_date)
+        return self._timeseries_for(state, district, window, granularity, stream)
+
+    def _timeseries_for(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        granularity: str,
+        stream: str = "enrol",
+    ) -> List[Dict[str, object]]:
+        return self._cached(
+            "timeseries",
+            state,
+            district,
+            window,
+            lambda: self.backend.timeseries(self, state, district, window, granularity, stream),
+            granularity,
+            stream,
+        )
+
+    @pinned
+    def map_view(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        preset: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        level: str,
+        stream: str = "enrol",
+    ) -> List[Dict[str, object]]:
+        if self.max_date is pd.NaT:
             return []
+        window = resolve_window(preset, start, end, self.max_date)
+        return self._map_rows(state, district, window, level, stream)
+
+    def _map_rows(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        level: str,
+        stream: str = "enrol",
+    ) -> List[Dict[str, object]]:
+        if level == "district" and not state:
+            level = "state"
+        if level == "state" and stream == "enrol":
+            return self._state_metrics(state, district, window)
+        return self._cached(
+            "map",
+            state,
+            district,
+            window,
+            lambda: self.backend.map_view(self, state, district, window, level, stream),
+            level,
+            stream,
+        )
 
-        print(f"Enrol DataFrame head after filtering:\n{enrol.head()}")
+    def _state_metrics(
+        self, state: Optional[str], district: Optional[str], window: Tuple[pd.Timestamp, pd.Timestamp]
+    ) -> List[Dict[str, object]]:
+        """Per-state map rows, computed once per filter set for /map, /comparisons and /insights."""
+        return self._cached(
+            "state_metrics", state, district, window, lambda: self.backend.map_view(self, state, district, window, "state")
+        )
 
-        freq_map = {"monthly": "M", "quarterly": "Q", "yearly": "A"}
-        freq = freq_map.get(granularity, "M")
+    def _map_view(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        level: str,
+        stream: str = "enrol",
+    ) -> List[Dict[str, object]]:
+        index, groups = self._spans(stream, state, district, window, level=level)
+        if not groups:
+            return []
+
+        count_cols = [index.columns.index(col) for col in STREAM_COLUMNS[stream]]
+        adult_cols = [index.columns.index(col) for col in ADULT_COLUMNS[stream]]
+        with log_stage("map.groups", groups=len(groups), level=level, stream=stream):
+            totals = np.array([index.totals(first, last) for _, first, last in groups])
 
-        grouped = (
-            enrol.set_index("date")[["age_0_5", "age_5_17", "age_18_greater"]]
-            .resample(freq)
-            .sum()
-            .reset_index()
+            # Growth: adult activity in each group's last month vs. its first month.
+            first = np.array(
+                [index.month_totals(lo, hi, index.month_of(lo))[adult_cols].sum() for _, lo, hi in groups],
+                dtype=float,
+            )
+            last = np.array(
+                [index.month_totals(lo, hi, index.month_of(hi - 1))[adult_cols].sum() for _, lo, hi in groups],
+                dtype=float,
+            )
+        return map_payload(
+            [key for key, _, _ in groups],
+            level,
+            totals[:, count_cols].sum(axis=1),
+            totals[:, adult_cols].sum(axis=1),
+            first,
+            last,
         )
-        print(f"Grouped DataFrame head after resampling:\n{grouped.head()}")
-        grouped["total"] = grouped[["age_0_5", "age_5_17", "age_18_greater"]].sum(axis=1)
-        grouped["adult_share"] = np.where(grouped["total"] > 0, grouped["age_18_greater"] / grouped["total"], 0)
-        print(f"Grouped DataFrame head after calculating total and adult_share:\n{grouped.head()}")
-        return [
+
+    @pinned
+    def pincodes(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        preset: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        limit: int,
+        offset: int,
+    ) -> Dict[str, object]:
+        """One page of per-pincode activity in the window, busiest pincodes first."""
+        table = pd.DataFrame(columns=PINCODE_FIELDS)
+        if self.max_date is not pd.NaT:
+            window = resolve_window(preset, start, end, self.max_date)
+            table = self._cached(
+                "pincodes", state, district, window, lambda: self._pincode_table(state, district, window)
+            )
+        page = table.iloc[offset : offset + limit]
+        items = [
             {
-                "date": row["date"].date().isoformat(),
-                "adultShare": round(row["adult_share"] * 100, 2),
-                "totalActivity": int(row["total"]),
+                "pincode": int(pincode),
+                "state": state_name,
+                "district": district_name,
+                "enrolment": int(enrolment),
+                "biometric": int(biometric),
+                "demographic": int(demographic),
+                "totalActivity": int(activity),
+                "migrationProxy": float(proxy),
             }
-            for _, row in grouped.iterrows()
+            for pincode, state_name, district_name, enrolment, biometric, demographic, activity, proxy in zip(
+                *(page[col].tolist() for col in PINCODE_FIELDS)
+            )
         ]
+        return {"total": len(table), "offset": offset, "limit": limit, "items": items}
 
-    def map_view(
+    def _pincode_table(
+        self, state: Optional[str], district: Optional[str], window: Tuple[pd.Timestamp, pd.Timestamp]
+    ) -> pd.DataFrame:
+        """Window activity per pincode across the three datasets, sorted busiest first."""
+        names = {"enrol": "enrolment", "bio": "biometric", "demo": "demographic"}
+        parts = []
+        for key, index in self.pincode_indexes.items():
+            if state:
+                parents = [(state, district) if district else (state,)]
+            elif district:
+                parents = [run for run in index.runs if len(run) == 2 and run[1] == district]
+            else:
+                parents = None
+            with log_stage("pincodes.totals", dataset=key, state=state, district=district):
+                totals = index.window_totals(parents, *window)
+            if totals.empty:
+                continue
+            part = totals[PincodeIndex.KEYS].copy()
+            part[names[key]] = totals[index.columns].sum(axis=1)
+            if key == "enrol":
+                part["adult"] = totals["age_18_greater"]
+            parts.append(part)
+        if not parts:
+            return pd.DataFrame(columns=PINCODE_FIELDS)
+
+        table = concat_frames(parts).groupby(PincodeIndex.KEYS, observed=True).sum().reset_index()
+        for column in (*names.values(), "adult"):
+            table[column] = table[column].fillna(0).astype(np.int64) if column in table else 0
+        table["totalActivity"] = table[list(names.values())].sum(axis=1)
+        enrol, adult = table["enrolment"].to_numpy(dtype=float), table["adult"].to_numpy(dtype=float)
+        table["migrationProxy"] = np.round(np.divide(adult, enrol, out=np.zeros(len(enrol)), where=enrol > 0) * 100, 2)
+        table = table.sort_values(["totalActivity", "pincode"], ascending=[False, True], kind="stable")
+        return table[PINCODE_FIELDS].reset_index(drop=True)
+
+    @pinned
+    def export_frames(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        preset: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        view: str,
+        stream: str,
+    ) -> Tuple[List[str], Iterator[pd.DataFrame]]:
+        """Columns and row chunks of ``stream`` for /export.
+
+        ``view="rows"`` yields the daily (date, state, district) rollup rows ``_filter_df``
+        would return; ``view="pincodes"`` the cleaned pincode-level rows (not available for
+        ``combined``). Row ranges are resolved here against the current generation, and the
+        generator holds on to that generation's frames. It only slices them, so it can be
+        consumed later, from any thread, without ever holding the whole result.
+        """
+        if self.max_date is pd.NaT:
+            return [], iter(())
+        window = resolve_window(preset, start, end, self.max_date)
+        if view == "pincodes":
+            index = self.pincode_indexes.get(stream)
+            columns = [*ROLLUP_KEYS, "pincode", *(index.columns if index else COUNT_COLUMNS[stream])]
+            if index is None:
+                return columns, iter(())
+            if state and district:
+                parents: Optional[List[Tuple]] = [(state, district)]
+            elif state:
+                parents = [(state,)]
+            elif district:
+                parents = [parent for parent in index.runs if parent[1:] == (district,)]
+            else:
+                parents = None
+            return columns, frame_chunks(index.frame, index.row_ranges(parents), columns, window)
+
+        index, spans = self._spans(stream, state, district, window)
+        columns = [*ROLLUP_KEYS, *(index.columns if index else STREAM_COLUMNS[stream])]
+        if index is None:
+            return columns, iter(())
+        return columns, frame_chunks(index.frame, [(first, last) for _, first, last in spans], columns, order=index.order)
+
+    @pinned
+    def risk(
         self,
         state: Optional[str],
         district: Optional[str],
@@ -270,53 +2069,197 @@ class DataStore:
     ) -> List[Dict[str, object]]:
         if self.max_date is pd.NaT:
             return []
-        window_start, window_end = resolve_window(preset, start, end, self.max_date)
-        enrol = self._filter_df(self.datasets["enrol"], state, district, window_start, window_end)
-        if enrol.empty:
-            return []
+        window = resolve_window(preset, start, end, self.max_date)
+        return self._cached("risk", state, district, window, lambda: self._risk(state, district, window, level), level)
 
-        if level == "district" and not state:
-            level = "state"
+    def _risk(
+        self, state: Optional[str], district: Optional[str], window: Tuple[pd.Timestamp, pd.Timestamp], level: str
+    ) -> List[Dict[str, object]]:
+        """Identity risk index per state or district, highest first.
+
+        IER is enrolment against annual births (split evenly across a state's districts at
+        district level), BCR and DV are biometric and demographic updates per enrolment,
+        and IRI weights them 0.4/0.3/0.3. Groups are those with enrolment rows in the window.
+        """
+        index, groups = self._spans("combined", state, district, window, level=level)
+        enrolled = {key for key, _, _ in self._spans("enrol", state, district, window, level=level)[1]}
+        groups = [group for group in groups if group[0] in enrolled]
+        if not groups:
+            return []
 
-        group_cols = ["state"] if level == "state" else ["state", "district"]
-        grouped = enrol.groupby(group_cols)
+        totals = np.array([index.totals(first, last) for _, first, last in groups])
+        enrol, bio, demo = (
+            totals[:, [index.columns.index(col) for col in COUNT_COLUMNS[key]]].sum(axis=1).astype(float)
+            for key in ("enrol", "bio", "demo")
+        )
+        states = [key[0] for key, _, _ in groups]
+        births = np.array([CRS_BIRTHS.get(name, CRS_DEFAULT_BIRTHS) for name in states], dtype=float)
+        if level == "district":
+            births /= np.array([max(len(self.state_to_district.get(name, ())), 1) for name in states])
+
+        ier = np.maximum(enrol / births * 10, 0.01)
+        bcr = bio / np.maximum(enrol, 1) * 5
+        dv = demo / np.maximum(enrol, 1) * 5
+        iri = ier * 0.4 + bcr * 0.3 + dv * 0.3
+        tier = np.select([iri >= floor for _, floor, _ in RISK_TIERS], np.arange(len(RISK_TIERS)))
+        ier, bcr, dv, iri = (np.round(values, 2) for values in (ier, bcr, dv, iri))
 
         rows = []
-        for key, frame in grouped:
-            totals = frame[["age_0_5", "age_5_17", "age_18_greater"]].sum()
-            total_activity = totals.sum()
-            adult_share = (totals["age_18_greater"] / total_activity) if total_activity else 0
-
-            monthly = frame.set_index("date")["age_18_greater"].resample("M").sum()
-            growth_pct = calc_growth(monthly)
-
-            if level == "district":
-                state_name, district_name = key
-                name = f"{district_name}, {state_name}"
-                identifier = district_name
-            else:  # level == "state"
-                state_name = key[0] if isinstance(key, tuple) else key
-                name = state_name
-                identifier = state_name
-
+        for i in np.argsort(-iri, kind="stable").tolist():
+            key = groups[i][0]
+            name, colour = RISK_TIERS[tier[i]][0], RISK_TIERS[tier[i]][2]
             rows.append(
                 {
-                    "id": identifier,
-                    "state": key[0] if isinstance(key, tuple) else key,
-                    "name": name,
-                    "migrationProxy": round(adult_share * 100, 2),
-                    "growthPct": growth_pct,
-                    "totalActivity": int(total_activity),
+                    "id": key[-1] if level == "district" else key[0],
+                    "state": key[0],
+                    "name": f"{key[1]}, {key[0]}" if level == "district" else key[0],
+                    "iri": float(iri[i]),
+                    "ier": float(ier[i]),
+                    "bcr": float(bcr[i]),
+                    "dv": float(dv[i]),
+                    "tier": name,
+                    "color": colour,
+                    "enrolment": int(enrol[i]),
+                    "biometric": int(bio[i]),
+                    "demographic": int(demo[i]),
                 }
             )
-
-        rows = sorted(rows, key=lambda r: r["migrationProxy"], reverse=True)
         return rows
 
+    @pinned
+    def anomalies(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        preset: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        level: str,
+        stream: str = "enrol",
+        limit: int = 100,
+    ) -> Dict[str, object]:
+        if self.max_date is pd.NaT:
+            return {"weeks": [], "groups": [], "anomalies": []}
+        window = resolve_window(preset, start, end, self.max_date)
+        result = self._anomalies_for(state, district, window, level, stream)
+        return {**result, "anomalies": result["anomalies"][:limit]}
+
+    def _anomalies_for(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        level: str,
+        stream: str = "enrol",
+    ) -> Dict[str, object]:
+        return self._cached(
+            "anomalies",
+            state,
+            district,
+            window,
+            lambda: self._anomalies(state, district, window, level, stream),
+            level,
+            stream,
+        )
+
+    def _weekly_activity(
+        self,
+        stream: str,
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        level: str,
+    ) -> Tuple[List[Tuple], np.ndarray, List[str]]:
+        """Group keys, a (groups x weeks) activity matrix and each week's end date.
+
+        Weeks end on the window's last day; leading days that do not fill a week are dropped.
+        """
+        first_day = np.datetime64(window[0].ceil("D").date(), "D")
+        last_day = np.datetime64(window[1].floor("D").date(), "D")
+        days = max(int((last_day - first_day).astype(np.int64)) + 1, 0)
+        weeks = days // 7
+        week_ends = [str(last_day - 7 * (weeks - 1 - week)) for week in range(weeks)]
+        index, groups = self._spans(stream, state, district, window, level=level)
+        if not groups or not weeks:
+            return [], np.zeros((0, weeks), dtype=np.int64), week_ends
+
+        # One row of the daily matrix per group, filled with a single bincount.
+        rows = np.concatenate([np.arange(first, last) for _, first, last in groups])
+        group_ids = np.repeat(np.arange(len(groups)), [last - first for _, first, last in groups])
+        columns = [index.columns.index(col) for col in STREAM_COLUMNS[stream]]
+        values = (index.cumsum[rows + 1][:, columns] - index.cumsum[rows][:, columns]).sum(axis=1)
+        day = (index.dates[rows].astype("datetime64[D]") - first_day).astype(np.int64)
+        daily = np.bincount(group_ids * days + day, weights=values, minlength=len(groups) * days)
+        daily = daily.reshape(len(groups), days)[:, days - weeks * 7 :]
+        weekly = daily.reshape(len(groups), weeks, 7).sum(axis=2).astype(np.int64)
+        return [key for key, _, _ in groups], weekly, week_ends
+
+    def _anomalies(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        window: Tuple[pd.Timestamp, pd.Timestamp],
+        level: str,
+        stream: str = "enrol",
+    ) -> Dict[str, object]:
+        """Week-over-week change, rolling growth and z-score anomaly flags for every group."""
+        with log_stage("anomalies.weekly", level=level, stream=stream):
+            keys, weekly, week_ends = self._weekly_activity(stream, state, district, window, level)
+        if not keys:
+            return {"weeks": week_ends, "groups": [], "anomalies": []}
+
+        with log_stage("anomalies.score", groups=len(keys), weeks=len(week_ends)):
+            z, expected = trailing_zscores(weekly, ANOMALY_BASELINE_WEEKS, ANOMALY_MIN_WEEKS)
+            flagged = np.abs(z) >= ANOMALY_Z
+            latest = weekly[:, -1].astype(float)
+            previous = weekly[:, -2].astype(float) if weekly.shape[1] > 1 else np.zeros(len(keys))
+            wow = np.divide(latest - previous, previous, out=np.zeros(len(keys)), where=previous != 0) * 100
+            span = min(ROLLING_GROWTH_WEEKS, weekly.shape[1] // 2)
+            recent = weekly[:, weekly.shape[1] - span :].sum(axis=1).astype(float)
+            prior = weekly[:, weekly.shape[1] - 2 * span : weekly.shape[1] - span].sum(axis=1).astype(float)
+            rolling = np.divide(recent - prior, prior, out=np.zeros(len(keys)), where=prior != 0) * 100
+
+        def describe(key: Tuple) -> Dict[str, object]:
+            if level == "district":
+                return {"id": key[1], "state": key[0], "name": f"{key[1]}, {key[0]}"}
+            return {"id": key[0], "state": key[0], "name": key[0]}
+
+        latest_z = z[:, -1]
+        groups = [
+            {
+                **describe(keys[i]),
+                "latestWeek": int(weekly[i, -1]),
+                "previousWeek": int(previous[i]),
+                "wowPct": round(float(wow[i]), 2),
+                "rollingGrowthPct": round(float(rolling[i]), 2),
+                "zScore": round(float(latest_z[i]), 2),
+                "anomaly": bool(flagged[i, -1]),
+                "anomalousWeeks": int(flagged[i].sum()),
+            }
+            for i in np.argsort(-np.abs(latest_z), kind="stable").tolist()
+        ]
+        group_ids, week_ids = np.nonzero(flagged)
+        order = np.argsort(-np.abs(z[group_ids, week_ids]), kind="stable")
+        anomalies = [
+            {
+                **describe(keys[g]),
+                "weekEnding": week_ends[w],
+                "value": int(weekly[g, w]),
+                "expected": round(float(expected[g, w]), 2),
+                "zScore": round(float(z[g, w]), 2),
+            }
+            for g, w in zip(group_ids[order].tolist(), week_ids[order].tolist())
+        ]
+        return {"weeks": week_ends, "groups": groups, "anomalies": anomalies}
+
+    @pinned
     def comparisons(
         self, state: Optional[str], district: Optional[str], preset: Optional[str], start: Optional[str], end: Optional[str]
     ) -> Dict[str, List[Dict[str, object]]]:
-        data = self.map_view(state, district, preset, start, end, level="state")
+        window = resolve_window(preset, start, end, self.max_date)
+        return self._comparisons(self._state_metrics(state, district, window))
+
+    def _comparisons(self, data: List[Dict[str, object]]) -> Dict[str, List[Dict[str, object]]]:
         top_states = data[:12]
         scatter = [
             {
@@ -329,10 +2272,24 @@ class DataStore:
         ]
         return {"states": top_states, "scatter": scatter}
 
+    @pinned
     def insights(
         self, state: Optional[str], district: Optional[str], preset: Optional[str], start: Optional[str], end: Optional[str]
     ) -> List[str]:
-        data = self.map_view(state, district, preset, start, end, level="state")
+        window = resolve_window(preset, start, end, self.max_date)
+        anomalies = self._insight_anomalies(state, district, window)
+        return self._insights(self._state_metrics(state, district, window), anomalies)
+
+    def _insight_anomalies(
+        self, state: Optional[str], district: Optional[str], window: Tuple[pd.Timestamp, pd.Timestamp]
+    ) -> List[Dict[str, object]]:
+        """Groups whose latest week is anomalous: districts within a state, states otherwise."""
+        result = self._anomalies_for(state, district, window, "district" if state else "state")
+        return [row for row in result["groups"] if row["anomaly"]]
+
+    def _insights(
+        self, data: List[Dict[str, object]], anomalies: Optional[List[Dict[str, object]]] = None
+    ) -> List[str]:
         if not data:
             return ["No data available for the selected filters."]
 
@@ -352,17 +2309,338 @@ class DataStore:
             insights.append(
                 f"{len(high_signal)} states exceed the 55% adult-activity proxy threshold, suggesting elevated migration pull factors."
             )
+
+        if anomalies:
+            insights.append(
+                f"Latest-week activity breaks sharply from its {ANOMALY_BASELINE_WEEKS}-week baseline in "
+                f"{len(anomalies)} area(s), led by {', '.join(r['id'] for r in anomalies[:3])}."
+            )
         return insights
 
+    @pinned
+    def dashboard(
+        self,
+        state: Optional[str],
+        district: Optional[str],
+        preset: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        granularity: str,
+        level: str,
+    ) -> Dict[str, object]:
+        """Every dashboard panel for one filter set; the state metrics are shared by three panels."""
+        window = resolve_window(preset, start, end, self.max_date)
+        state_metrics = self._state_metrics(state, district, window)
+        return {
+            "summary": self._summary_for(state, district, window),
+            "timeseries": self._timeseries_for(state, district, window, granularity),
+            "map": self._map_rows(state, district, window, level),
+            "comparisons": self._comparisons(state_metrics),
+            "insights": self._insights(state_metrics, self._insight_anomalies(state, district, window)),
+        }
+
 
 store = DataStore()
 
+
+# Parent generation the store of this process-pool worker was last brought up to date with.
+_worker_generation: Optional[int] = None
+
+
+def _init_compute_worker(generation: int) -> None:
+    """Process-pool initializer: map the shared segment, or load this worker's own store."""
+    global _worker_generation
+    if store.shared is None or not store.attach():
+        store.load()
+    _worker_generation = generation
+
+
+def _sync_compute_worker(generation: int) -> None:
+    """Pick up the parent's reloads: refresh only once it has published a new generation."""
+    global _worker_generation
+    if generation == _worker_generation:
+        return
+    if store.shared is None or not store.attach():
+        store.refresh()
+    _worker_generation = generation
+
+
+_profile_lock = threading.Lock()
+
+
+def profile_breakdown(profiler: cProfile.Profile, limit: int = PROFILE_TOP_FUNCTIONS) -> List[Dict[str, object]]:
+    """The ``limit`` functions with the most cumulative time in ``profiler``."""
+    stats = pstats.Stats(profiler).stats
+    top = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {
+            "function": name,
+            "location": f"{Path(path).name}:{line}",
+            "calls": calls,
+            "ownMs": round(own * 1000, 3),
+            "cumulativeMs": round(cumulative * 1000, 3),
+        }
+        for (path, line, name), (_, calls, own, cumulative, _) in top
+    ]
+
+
+def _call_store(
+    method: str, args: Tuple, profile: bool = False, generation: Optional[int] = None
+) -> Tuple[object, Optional[List[Tuple[str, float]]], Optional[List[Dict[str, object]]]]:
+    """Executor entry point; in process mode this runs against the worker's own store.
+
+    ``generation`` is the parent's current generation, passed by process pools only.
+    Returns the result, its stage spans (None with Server-Timing off) and, for a profiled
+    call, the cProfile breakdown. Profiled calls skip the response cache.
+    """
+    if generation is not None:
+        _sync_compute_worker(generation)
+    with collect_stages(SERVER_TIMING or profile) as spans:
+        if not profile:
+            return getattr(store, method)(*args), spans, None
+        profiler = cProfile.Profile()
+        with _profile_lock:  # one active profiler per interpreter
+            store._local.uncached = True
+            try:
+                result = profiler.runcall(getattr(store, method), *args)
+            finally:
+                store._local.uncached = False
+        return result, spans, profile_breakdown(profiler)
+
+
+async def require_datasets(*keys: str) -> None:
+    """Wait, without blocking the event loop, until ``keys`` are loaded; 503 on timeout."""
+    deadline = time.monotonic() + WARMUP_TIMEOUT
+    while not store.is_ready(*keys):
+        if time.monotonic() > deadline:
+            raise HTTPException(status_code=503, detail=f"Warming up: waiting for {', '.join(keys)} data.")
+        await asyncio.sleep(0.05)
+
+
+def stream_datasets(stream: str) -> Tuple[str, ...]:
+    """Datasets a ``stream`` query reads: its own, or all three for "combined"."""
+    return tuple(CSV_FOLDERS) if stream == "combined" else (stream,)
+
+
+class ComputeDispatcher:
+    """Runs DataStore queries on a bounded pool, off the event loop.
+
+    Each endpoint has its own concurrency limit, so a burst of slow district maps
+    cannot take every worker. Identical queries that are in flight at the same time
+    share one computation.
+    """
+
+    def __init__(self, kind: str, workers: int, per_endpoint: int) -> None:
+        self.kind = kind
+        self.workers = workers
+        self.per_endpoint = per_endpoint
+        self._executor: Optional[Executor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self.coalesced = 0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                # spawn, not fork: the loader, watcher, materializer and event loop threads are live.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_compute_worker,
+                    initargs=(store.current.generation,),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="compute")
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, method: str, *args: object, profile: bool = False) -> Tuple:
+        """``(result, spans, profile)`` from ``_call_store``."""
+        key = (method, args, profile)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            semaphore = self._semaphores.setdefault(method, asyncio.Semaphore(self.per_endpoint))
+            async with semaphore:
+                generation = store.current.generation if self.kind == "process" else None
+                result = await loop.run_in_executor(self.executor, _call_store, method, args, profile, generation)
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # waiters re-raise it; mark it retrieved for the leader
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "pool": self.kind,
+            "workers": self.workers,
+            "perEndpoint": self.per_endpoint,
+            "inFlight": len(self._inflight),
+            "coalesced": self.coalesced,
+        }
+
+
+compute = ComputeDispatcher(COMPUTE_POOL, COMPUTE_WORKERS, ENDPOINT_CONCURRENCY)
+
+
+def to_columns(rows: List[Dict[str, object]]) -> Dict[str, List[object]]:
+    """Row dicts as parallel arrays, so each field name is sent once."""
+    return {field: [row[field] for row in rows] for field in (rows[0] if rows else ())}
+
+
+def response_etag(request: Request) -> str:
+    """Weak validator: identical while the data generation and the query string are unchanged."""
+    data = store.current
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    seed = f"{data.generation}|{data.last_refreshed.isoformat()}|{request.url.path}?{query}"
+    return f'W/"{hashlib.sha1(seed.encode("utf-8")).hexdigest()[:20]}"'
+
+
+async def respond(request: Request, method: str, *args: object, columnar: bool = False) -> Response:
+    """Run ``method`` on the compute pool, or answer 304 if the client's copy is current.
+
+    Stage spans go out as ``Server-Timing``. With ``?profile=1`` the response is a cProfile
+    breakdown of an uncached run instead of the payload.
+    """
+    profile = PROFILING and request.query_params.get("profile") == "1"
+    etag = response_etag(request)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if not profile and etag in {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}:
+        return Response(status_code=304, headers=headers)
+    began = time.perf_counter()
+    payload, spans, breakdown = await compute.run(method, *args, profile=profile)
+    computed = time.perf_counter()
+    response = PayloadResponse(to_columns(payload) if columnar else payload, headers=headers)
+    if spans is not None:
+        spans = [*spans, ("compute", (computed - began) * 1000), ("encode", (time.perf_counter() - computed) * 1000)]
+        response.headers["Server-Timing"] = server_timing(spans)
+    if not profile:
+        return response
+    return PayloadResponse(
+        {
+            "method": method,
+            "payloadBytes": len(response.body),
+            "stages": [{"stage": stage, "ms": round(elapsed_ms, 3)} for stage, elapsed_ms in spans],
+            "functions": breakdown,
+        },
+        headers={"Server-Timing": response.headers["Server-Timing"], "Cache-Control": "no-store"},
+    )
+
+
+class RequestMetrics:
+    """Per-route request counts and latency histograms, rendered in the Prometheus text format.
+
+    Only touched from the event loop. Each uvicorn worker process keeps its own.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self._latency: Dict[str, List[int]] = {}  # per-bucket counts, last one is +Inf
+        self._seconds: Dict[str, float] = {}
+        self._statuses: Dict[Tuple[str, int], int] = {}
+
+    def observe(self, route: str, status: int, seconds: float) -> None:
+        counts = self._latency.setdefault(route, [0] * (len(self.buckets) + 1))
+        counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self._seconds[route] = self._seconds.get(route, 0.0) + seconds
+        self._statuses[(route, status)] = self._statuses.get((route, status), 0) + 1
+
+    def render(self) -> List[str]:
+        lines = [
+            "# HELP uidai_request_duration_seconds Request latency by route.",
+            "# TYPE uidai_request_duration_seconds histogram",
+        ]
+        for route, counts in sorted(self._latency.items()):
+            cumulative = 0
+            for bound, count in zip((*map(repr, self.buckets), "+Inf"), counts):
+                cumulative += count
+                lines.append(f'uidai_request_duration_seconds_bucket{{route="{route}",le="{bound}"}} {cumulative}')
+            lines.append(f'uidai_request_duration_seconds_sum{{route="{route}"}} {self._seconds[route]:.6f}')
+            lines.append(f'uidai_request_duration_seconds_count{{route="{route}"}} {cumulative}')
+        lines += ["# HELP uidai_requests_total Requests by route and status code.", "# TYPE uidai_requests_total counter"]
+        for (route, status), count in sorted(self._statuses.items()):
+            lines.append(f'uidai_requests_total{{route="{route}",status="{status}"}} {count}')
+        return lines
+
+
+request_metrics = RequestMetrics(LATENCY_BUCKETS)
+
+
+class TimingMiddleware:
+    """Appends the request's ``total`` to ``Server-Timing`` and records it in ``request_metrics``."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        began = time.perf_counter()
+        status = 500
+
+        async def send_timed(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if SERVER_TIMING:
+                    headers = MutableHeaders(scope=message)
+                    total = f"total;dur={(time.perf_counter() - began) * 1000:.2f}"
+                    stages = headers.get("server-timing")
+                    headers["Server-Timing"] = f"{stages}, {total}" if stages else total
+                    headers["Timing-Allow-Origin"] = "*"  # lets the dashboard's devtools show it
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            # The router fills in "endpoint"; unknown paths share one series.
+            route = scope["path"] if scope.get("endpoint") else "unmatched"
+            request_metrics.observe(route, status, time.perf_counter() - began)
+
+
+class BufferedGZipMiddleware(GZipMiddleware):
+    """GZip for buffered responses only: /export compresses its own stream, off the event loop."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] == "/export":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    store.start_loading()
+    store.start_watching()
+    yield
+    store.stop_watching()
+    compute.shutdown()
+
+
 app = FastAPI(
     title="UIDAI Migration & Urbanization Tracker API",
     description="Data API powering the migration and urbanization dashboard.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+app.add_middleware(BufferedGZipMiddleware, minimum_size=GZIP_MIN_BYTES)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -370,24 +2648,59 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(TimingMiddleware)
 
 
 @app.get("/health")
-def health() -> Dict[str, object]:
+async def health() -> Dict[str, object]:
+    data = store.current
     return {
-        "status": "ok",
-        "lastRefreshed": store.last_refreshed.isoformat(),
-        "health": store.health,
+        "status": "ok" if store.is_ready() else "warming",
+        "ready": {key: key in data.ready for key in CSV_FOLDERS},
+        "generation": data.generation,
+        "lastRefreshed": data.last_refreshed.isoformat(),
+        "health": data.health,
+        "cache": {"enabled": store.cache.enabled, "folders": data.cache_stats},
+        "responseCache": store.responses.stats(),
+        "compute": compute.stats(),
+        "queryBackend": store.backend.name,
+        "materialized": {"entries": len(data.materialized), "complete": data.materialized_complete},
+        "shared": (
+            {"role": "leader" if store.shared.leader else "follower", "segment": store._attached}
+            if store.shared is not None
+            else None
+        ),
     }
 
 
+@app.get("/metrics")
+async def metrics() -> Response:
+    """Prometheus text exposition: request latency histograms plus store and cache counters."""
+    cache, pool = store.responses.stats(), compute.stats()
+    lines = request_metrics.render()
+    for name, kind, help_text, value in (
+        ("uidai_data_generation", "gauge", "Generation of the published data.", store.current.generation),
+        ("uidai_data_ready", "gauge", "1 once every dataset is loaded.", int(store.is_ready())),
+        ("uidai_response_cache_entries", "gauge", "Responses held in the LRU cache.", cache["size"]),
+        ("uidai_response_cache_hits_total", "counter", "Response cache hits.", cache["hits"]),
+        ("uidai_response_cache_misses_total", "counter", "Response cache misses.", cache["misses"]),
+        ("uidai_response_cache_evictions_total", "counter", "Response cache evictions.", cache["evictions"]),
+        ("uidai_compute_in_flight", "gauge", "Queries running on the compute pool.", pool["inFlight"]),
+        ("uidai_compute_coalesced_total", "counter", "Requests that joined an identical in-flight query.", pool["coalesced"]),
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+
 @app.get("/meta")
-def meta() -> Dict[str, object]:
+async def meta() -> Dict[str, object]:
+    await require_datasets("enrol")
+    data = store.current
     return {
-        "states": list(store.state_to_district.keys()),
-        "districts": store.state_to_district,
-        "minDate": store.min_date.date().isoformat() if store.min_date is not pd.NaT else None,
-        "maxDate": store.max_date.date().isoformat() if store.max_date is not pd.NaT else None,
+        "states": list(data.state_to_district.keys()),
+        "districts": data.state_to_district,
+        "minDate": data.min_date.date().isoformat() if data.min_date is not pd.NaT else None,
+        "maxDate": data.max_date.date().isoformat() if data.max_date is not pd.NaT else None,
         "quickPresets": {
             "lastMonth": "1m",
             "last3Months": "3m",
@@ -398,58 +2711,191 @@ def meta() -> Dict[str, object]:
 
 
 @app.get("/summary")
-def summary(
+async def summary(
+    request: Request,
     state: Optional[str] = Query(default=None),
     district: Optional[str] = Query(default=None),
     preset: Optional[str] = Query(default="3m"),
     start: Optional[str] = Query(default=None),
     end: Optional[str] = Query(default=None),
-) -> Dict[str, object]:
-    return store.summary(state, district, preset, start, end)
+) -> Response:
+    await require_datasets(*CSV_FOLDERS)
+    return await respond(request, "summary", state, district, preset, start, end)
 
 
 @app.get("/timeseries")
-def timeseries(
+async def timeseries(
+    request: Request,
     state: Optional[str] = Query(default=None),
     district: Optional[str] = Query(default=None),
     preset: Optional[str] = Query(default="6m"),
     start: Optional[str] = Query(default=None),
     end: Optional[str] = Query(default=None),
     granularity: str = Query(default="monthly", pattern="^(monthly|quarterly|yearly)$"),
-) -> List[Dict[str, object]]:
-    return store.working_age_timeseries(state, district, preset, start, end, granularity)
+    stream: str = Query(default="enrol", pattern="^(enrol|bio|demo|combined)$"),
+    fmt: str = Query(default="rows", alias="format", pattern="^(rows|columns)$"),
+) -> Response:
+    await require_datasets(*stream_datasets(stream))
+    return await respond(
+        request,
+        "working_age_timeseries",
+        state,
+        district,
+        preset,
+        start,
+        end,
+        granularity,
+        stream,
+        columnar=fmt == "columns",
+    )
 
 
 @app.get("/map")
-def map_view(
+async def map_view(
+    request: Request,
     state: Optional[str] = Query(default=None),
     district: Optional[str] = Query(default=None),
     preset: Optional[str] = Query(default="6m"),
     start: Optional[str] = Query(default=None),
     end: Optional[str] = Query(default=None),
     level: str = Query(default="state", pattern="^(state|district)$"),
-) -> List[Dict[str, object]]:
-    return store.map_view(state, district, preset, start, end, level)
+    stream: str = Query(default="enrol", pattern="^(enrol|bio|demo|combined)$"),
+    fmt: str = Query(default="rows", alias="format", pattern="^(rows|columns)$"),
+) -> Response:
+    await require_datasets(*stream_datasets(stream))
+    return await respond(
+        request, "map_view", state, district, preset, start, end, level, stream, columnar=fmt == "columns"
+    )
+
+
+@app.get("/pincodes")
+async def pincodes(
+    request: Request,
+    state: Optional[str] = Query(default=None),
+    district: Optional[str] = Query(default=None),
+    preset: Optional[str] = Query(default="6m"),
+    start: Optional[str] = Query(default=None),
+    end: Optional[str] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+) -> Response:
+    await require_datasets(*CSV_FOLDERS)
+    return await respond(request, "pincodes", state, district, preset, start, end, limit, offset)
+
+
+@app.get("/risk")
+async def risk(
+    request: Request,
+    state: Optional[str] = Query(default=None),
+    district: Optional[str] = Query(default=None),
+    preset: Optional[str] = Query(default="1y"),
+    start: Optional[str] = Query(default=None),
+    end: Optional[str] = Query(default=None),
+    level: str = Query(default="state", pattern="^(state|district)$"),
+) -> Response:
+    await require_datasets(*CSV_FOLDERS)
+    return await respond(request, "risk", state, district, preset, start, end, level)
+
+
+@app.get("/anomalies")
+async def anomalies(
+    request: Request,
+    state: Optional[str] = Query(default=None),
+    district: Optional[str] = Query(default=None),
+    preset: Optional[str] = Query(default="6m"),
+    start: Optional[str] = Query(default=None),
+    end: Optional[str] = Query(default=None),
+    level: str = Query(default="state", pattern="^(state|district)$"),
+    stream: str = Query(default="enrol", pattern="^(enrol|bio|demo|combined)$"),
+    limit: int = Query(default=100, ge=1, le=5000),
+) -> Response:
+    await require_datasets(*stream_datasets(stream))
+    return await respond(request, "anomalies", state, district, preset, start, end, level, stream, limit)
 
 
 @app.get("/comparisons")
-def comparisons(
+async def comparisons(
+    request: Request,
     state: Optional[str] = Query(default=None),
     district: Optional[str] = Query(default=None),
     preset: Optional[str] = Query(default="6m"),
     start: Optional[str] = Query(default=None),
     end: Optional[str] = Query(default=None),
-) -> Dict[str, List[Dict[str, object]]]:
-    return store.comparisons(state, district, preset, start, end)
+) -> Response:
+    await require_datasets("enrol")
+    return await respond(request, "comparisons", state, district, preset, start, end)
 
 
 @app.get("/insights")
-def insights(
+async def insights(
+    request: Request,
     state: Optional[str] = Query(default=None),
     district: Optional[str] = Query(default=None),
     preset: Optional[str] = Query(default="3m"),
     start: Optional[str] = Query(default=None),
     end: Optional[str] = Query(default=None),
-) -> List[str]:
-    return store.insights(state, district, preset, start, end)
+) -> Response:
+    await require_datasets("enrol")
+    return await respond(request, "insights", state, district, preset, start, end)
+
+
+@app.get("/dashboard")
+async def dashboard(
+    request: Request,
+    state: Optional[str] = Query(default=None),
+    district: Optional[str] = Query(default=None),
+    preset: Optional[str] = Query(default="3m"),
+    start: Optional[str] = Query(default=None),
+    end: Optional[str] = Query(default=None),
+    granularity: str = Query(default="monthly", pattern="^(monthly|quarterly|yearly)$"),
+    level: str = Query(default="state", pattern="^(state|district)$"),
+) -> Response:
+    await require_datasets(*CSV_FOLDERS)
+    return await respond(request, "dashboard", state, district, preset, start, end, granularity, level)
+
 
+@app.get("/export")
+async def export(
+    request: Request,
+    state: Optional[str] = Query(default=None),
+    district: Optional[str] = Query(default=None),
+    preset: Optional[str] = Query(default="6m"),
+    start: Optional[str] = Query(default=None),
+    end: Optional[str] = Query(default=None),
+    view: str = Query(default="rows", pattern="^(rows|pincodes|map|timeseries)$"),
+    stream: str = Query(default="enrol", pattern="^(enrol|bio|demo|combined)$"),
+    level: str = Query(default="state", pattern="^(state|district)$"),
+    granularity: str = Query(default="monthly", pattern="^(monthly|quarterly|yearly)$"),
+    fmt: str = Query(default="csv", alias="format", pattern="^(csv|parquet)$"),
+) -> Response:
+    """Filtered rows, pincode rows, or the map/timeseries aggregate as a streamed CSV or Parquet file.
+
+    Rows are sliced from the loaded frames ``EXPORT_CHUNK_ROWS`` at a time and encoded as
+    the client reads them, so a national export never holds the whole result in memory.
+    """
+    if view == "pincodes" and stream == "combined":
+        raise HTTPException(status_code=400, detail="Pincode exports need stream=enrol, bio or demo.")
+    if fmt == "parquet" and pq is None:
+        raise HTTPException(status_code=501, detail="Parquet exports need pyarrow.")
+    await require_datasets(*stream_datasets(stream))
+    if view in ("map", "timeseries"):
+        if view == "map":
+            rows, _, _ = await compute.run("map_view", state, district, preset, start, end, level, stream)
+        else:
+            rows, _, _ = await compute.run("working_age_timeseries", state, district, preset, start, end, granularity, stream)
+        columns = AGGREGATE_EXPORT_FIELDS[view]
+        frames = iter([pd.DataFrame(rows, columns=columns)] if rows else [])
+    else:
+        columns, frames = await asyncio.to_thread(store.export_frames, state, district, preset, start, end, view, stream)
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="uidai-{view}-{stream}.{fmt}"',
+        "Cache-Control": "no-store",
+    }
+    if fmt == "parquet":
+        return StreamingResponse(parquet_stream(frames, columns), media_type="application/vnd.apache.parquet", headers=headers)
+    compress = accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers["Vary"] = "Accept-Encoding"
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(csv_stream(frames, columns, compress), media_type="text/csv", headers=headers)
@@ -0,0 +1,62 @@
+"""Fixtures: a small synthetic UIDAI extract loaded into a fresh DataStore."""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Before main is imported: no snapshot cache, shared segments, materializer or watcher.
+os.environ["UIDAI_CACHE_DIR"] = ""
+os.environ["UIDAI_MATERIALIZE"] = "0"
+os.environ["UIDAI_RELOAD_INTERVAL"] = "0"
+os.environ.pop("UIDAI_SHARED_DIR", None)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+# State spellings as they appear in the raw extracts; cleaning folds them together.
+DISTRICTS = {
+    "Bihar": ["Patna", "Gaya", "Nalanda"],
+    "Kerala": ["Ernakulam", "Kollam"],
+    "West Bengal": ["Howrah", "Nadia", "Hooghly"],
+    "west  bengal": ["Howrah"],
+    "WEST BENGAL": ["Nadia"],
+}
+
+
+def write_extract(root: Path, rows: int = 3000, days: int = 500, seed: int = 0) -> None:
+    """Write every dataset as two CSV files of random (date, state, district, pincode) rows."""
+    rng = np.random.default_rng(seed)
+    areas = [
+        (state, district, 800000 + 10 * position + pin)
+        for position, (state, districts) in enumerate(DISTRICTS.items())
+        for district in districts
+        for pin in range(2)
+    ]
+    areas.append(("Kerala", None, 690000))  # missing district
+    dates = (pd.Timestamp("2025-12-31") - pd.to_timedelta(np.arange(days), unit="D")).strftime("%d-%m-%Y")
+    for key, folder in main.CSV_FOLDERS.items():
+        picked = [areas[i] for i in rng.integers(0, len(areas), size=rows)]
+        frame = pd.DataFrame(picked, columns=["state", "district", "pincode"])
+        frame.insert(0, "date", dates[rng.integers(0, days, size=rows)])
+        for col in main.COUNT_COLUMNS[key]:
+            frame[col] = rng.integers(0, 40, size=rows)
+        (root / folder).mkdir(parents=True)
+        half = rows // 2
+        frame.iloc[:half].to_csv(root / folder / f"{folder}_0_{half}.csv", index=False)
+        frame.iloc[half:].to_csv(root / folder / f"{folder}_{half}_{rows}.csv", index=False)
+
+
+@pytest.fixture(scope="session")
+def store(tmp_path_factory: pytest.TempPathFactory) -> "main.DataStore":
+    root = tmp_path_factory.mktemp("extract")
+    write_extract(root)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(main, "DATA_DIR", root)
+        patch.chdir(root)
+        loaded = main.DataStore()
+        loaded.load()
+    return loaded
@@ -0,0 +1,72 @@
+"""The DuckDB query backend returns exactly the pandas backend's payloads."""
+
+import pytest
+
+import main
+
+pytest.importorskip("duckdb")
+
+FILTERS = [(None, None), ("Bihar", None), ("West Bengal", "Howrah"), (None, "Nadia"), ("Kerala", None), ("Nowhere", None)]
+WINDOWS = ["1m", "3m", "6m", "1y", "all", "custom"]
+STREAMS = ["enrol", "bio", "demo", "combined"]
+CASES = [pytest.param(f, w, id=f"{f[0]}-{f[1]}-{w}") for f in FILTERS for w in WINDOWS]
+
+
+@pytest.fixture(scope="module")
+def backends(store):
+    duck = main.DuckDBBackend()
+    duck.prepare(store.current)
+    yield main.PandasBackend(), duck
+    duck.close()
+
+
+def window_of(store, name):
+    if name == "all":
+        return store.min_date, store.max_date
+    if name == "custom":
+        return main.resolve_window(None, "2025-02-10", "2025-08-20", store.max_date)
+    return main.resolve_window(name, None, None, store.max_date)
+
+
+def test_fixture_cleaned_state_spellings(store):
+    assert sorted(store.state_to_district) == ["Bihar", "Kerala", "West Bengal"]
+
+
+@pytest.mark.parametrize("filters, window", CASES)
+def test_summary(store, backends, filters, window):
+    pandas, duck = backends
+    args = (store, *filters, window_of(store, window))
+    assert duck.summary(*args) == pandas.summary(*args)
+
+
+@pytest.mark.parametrize("filters, window", CASES)
+@pytest.mark.parametrize("granularity", ["monthly", "quarterly", "yearly"])
+def test_timeseries(store, backends, filters, window, granularity):
+    pandas, duck = backends
+    for stream in STREAMS:
+        args = (store, *filters, window_of(store, window), granularity, stream)
+        assert duck.timeseries(*args) == pandas.timeseries(*args), stream
+
+
+@pytest.mark.parametrize("filters, window", CASES)
+@pytest.mark.parametrize("level", ["state", "district"])
+def test_map_view(store, backends, filters, window, level):
+    pandas, duck = backends
+    for stream in STREAMS:
+        args = (store, *filters, window_of(store, window), level, stream)
+        assert duck.map_view(*args) == pandas.map_view(*args), stream
+
+
+@pytest.mark.parametrize("filters, window", CASES)
+def test_comparisons(store, backends, filters, window):
+    pandas, duck = backends
+    args = (store, *filters, window_of(store, window), "state")
+    assert store._comparisons(duck.map_view(*args)) == store._comparisons(pandas.map_view(*args))
+
+
+@pytest.mark.parametrize("filters, window", CASES)
+def test_insights(store, backends, filters, window):
+    """Compared without the anomaly bullet, which does not depend on the backend."""
+    pandas, duck = backends
+    args = (store, *filters, window_of(store, window), "state")
+    assert store._insights(duck.map_view(*args)) == store._insights(pandas.map_view(*args))
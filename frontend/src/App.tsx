@@ -7,7 +7,7 @@ import WorkingAgeChart from "./components/WorkingAgeChart";
 import GeoMap from "./components/GeoMap";
 import ComparisonPanels from "./components/ComparisonPanels";
 import InsightsPanel from "./components/InsightsPanel";
-import { fetchComparisons, fetchInsights, fetchMap, fetchMeta, fetchSummary, fetchTimeseries } from "./api/dashboard";
+import { fetchDashboard, fetchMeta } from "./api/dashboard";
 import { Filters } from "./types";
 
 const App = () => {
@@ -24,38 +24,14 @@ const App = () => {
 
   const metaQuery = useQuery({ queryKey: ["meta"], queryFn: fetchMeta });
 
-  const summaryQuery = useQuery({
-    queryKey: ["summary", filters],
-    queryFn: () => fetchSummary(filters),
-  });
-
-  const timeseriesQuery = useQuery({
-    queryKey: ["timeseries", filters],
-    queryFn: () => fetchTimeseries(filters),
-  });
-
   const mapLevel = filters.state ? "district" : "state";
-  const mapQuery = useQuery({
-    queryKey: ["map", filters, mapLevel],
-    queryFn: () => fetchMap(filters, mapLevel),
-  });
-
-  const comparisonsQuery = useQuery({
-    queryKey: ["comparisons", filters],
-    queryFn: () => fetchComparisons(filters),
-  });
-
-  const insightsQuery = useQuery({
-    queryKey: ["insights", filters],
-    queryFn: () => fetchInsights(filters),
+  const dashboardQuery = useQuery({
+    queryKey: ["dashboard", filters, mapLevel],
+    queryFn: () => fetchDashboard(filters, mapLevel),
   });
+  const dashboard = dashboardQuery.data;
 
-  const loading =
-    summaryQuery.isLoading ||
-    timeseriesQuery.isLoading ||
-    mapQuery.isLoading ||
-    comparisonsQuery.isLoading ||
-    insightsQuery.isLoading;
+  const loading = dashboardQuery.isLoading;
 
   const subtitle = useMemo(() => {
     if (filters.district) return `${filters.district}, ${filters.state}`;
@@ -73,7 +49,7 @@ const App = () => {
         onChange={(next) => setFilters((prev) => ({ ...prev, ...next }))}
       />
       <main className="main">
-        <Header lastRefreshed={summaryQuery.data?.lastRefreshed} />
+        <Header lastRefreshed={dashboard?.summary.lastRefreshed} />
 
         <div className="panel" id="overview">
           <p className="badge">Overall Objective</p>
@@ -82,17 +58,17 @@ const App = () => {
             Dashboard tracks Aadhaar activity as a proxy for migration & urbanization. Filters and drilldowns update all
             visuals in real time. Current scope: {subtitle}
           </p>
-          <KpiRow data={summaryQuery.data} />
+          <KpiRow data={dashboard?.summary} />
         </div>
 
-        <WorkingAgeChart data={timeseriesQuery.data ?? []} />
+        <WorkingAgeChart data={dashboard?.timeseries ?? []} />
 
         <div className="layout-two">
-          <GeoMap data={mapQuery.data ?? []} level={mapLevel} />
-          <InsightsPanel insights={insightsQuery.data} />
+          <GeoMap data={dashboard?.map ?? []} level={mapLevel} />
+          <InsightsPanel insights={dashboard?.insights} />
         </div>
 
-        <ComparisonPanels data={comparisonsQuery.data} />
+        <ComparisonPanels data={dashboard?.comparisons} />
 
         {loading && <p className="status">Loading latest analytics...</p>}
       </main>
@@ -53,3 +53,10 @@ export interface ComparisonsResponse {
   }[];
 }
 
+export interface DashboardResponse {
+  summary: SummaryResponse;
+  timeseries: TimeseriesPoint[];
+  map: MapFeatureDatum[];
+  comparisons: ComparisonsResponse;
+  insights: string[];
+}